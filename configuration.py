@@ -276,6 +276,8 @@ DIRECTION_DESTINATION_TO_SOURCES: DirectionType = "Destination to sources"
 DIRECTION_SOURCE_TO_DESTINATIONS: DirectionType = "Source to destinations"
 
 SELECT_CARD_BY_VALUES = ("None", "Random", "Least_reps")
+# For membership checks, the tuple keeps the order for listing the values in the UI
+SELECT_CARD_BY_VALUE_SET = frozenset(SELECT_CARD_BY_VALUES)
 SelectCardByType = Literal["None", "Random", "Least_reps"]
 
 
@@ -29,6 +29,7 @@ from ..configuration import (
     DIRECTION_DESTINATION_TO_SOURCES,
     DIRECTION_SOURCE_TO_DESTINATIONS,
     SELECT_CARD_BY_VALUES,
+    SELECT_CARD_BY_VALUE_SET,
     CardAction,
     Config,
     CopyDefinition,
@@ -1396,7 +1397,7 @@ def get_across_target_notes(
         logger.error("Error in copy fields: Required value 'select_card_by' was missing.")
         return []
 
-    if select_card_by not in SELECT_CARD_BY_VALUES:
+    if select_card_by not in SELECT_CARD_BY_VALUE_SET:
         logger.error(
             f"""Error in copy fields: incorrect 'select_card_by' value '{select_card_by}'.
             It must be one of {SELECT_CARD_BY_VALUES}""",
@@ -1,5 +1,6 @@
 import re
 import sys
+from functools import lru_cache
 from typing import Optional
 
 try:
@@ -8,6 +9,18 @@ except ImportError:
     from utils.logger import Logger
 
 
+@lru_cache(maxsize=32)
+def get_piped_flags(flags: str) -> int:
+    """
+    Combines the comma separated flag names, e.g. "IGNORECASE, DOTALL", into a single int.
+    Cached as the same few flag combinations get parsed again for every note being processed.
+    """
+    piped_flags = 0
+    for f in flags.split(", "):
+        piped_flags |= getattr(re, f)
+    return piped_flags
+
+
 def regex_process(
     text: str,
     regex: Optional[str],
@@ -29,14 +42,7 @@ def regex_process(
         logger.error("Error in basic_regex_process: Missing 'replacement'")
         return text
 
-    if not flags:
-        piped_flags = 0
-    else:
-        int_flags = [getattr(re, f) for f in flags.split(", ")]
-        piped_flags = int_flags[0]
-        # Combine rest of the flags with pipe
-        for f in int_flags[1:]:
-            piped_flags |= f
+    piped_flags = get_piped_flags(flags) if flags else 0
 
     logger.debug(
         f"Running regex:\n---\nregex:\n{regex}\n---\nreplacement: {replacement}\n---\ntext:\n"
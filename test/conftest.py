@@ -15,9 +15,39 @@ for _mod_name in [
     "anki.cards",
     "anki.notes",
     "anki.consts",
+    "anki.decks",
+    "anki.models",
     "aqt",
 ]:
     sys.modules.setdefault(_mod_name, MagicMock())
+# These are NewTypes of int in anki, keep them callable as such
+sys.modules["anki.models"].NotetypeId = int
+sys.modules["anki.decks"].DeckId = int
+
+
+# The ui modules subclass Qt widgets, which needs actual classes rather than MagicMocks.
+# Any other attribute, e.g. enum values like Qt.AlignmentFlag.AlignLeft, is a MagicMock.
+class _QtStubMeta(type):
+    def __getattr__(cls, name):
+        return MagicMock()
+
+
+class _QtStub(metaclass=_QtStubMeta):
+    def __init__(self, *args, **kwargs):
+        pass
+
+
+def _get_qt_stub(name: str):
+    stub = _QtStubMeta(name, (_QtStub,), {})
+    setattr(_qt_module, name, stub)
+    return stub
+
+
+_qt_module = types.ModuleType("aqt.qt")
+_qt_module.__getattr__ = _get_qt_stub
+# The ui modules pick their Qt enum aliases by comparing against the Qt major version
+_qt_module.qtmajor = 6
+sys.modules.setdefault("aqt.qt", _qt_module)
 
 # Register the addon and its subpackages under two names:
 #   1. The current directory name, whatever it is — guards against pytest's
@@ -35,6 +65,7 @@ for _base in [_addon_real_name, _STABLE_PACKAGE]:
         (_base, _project_dir),
         (f"{_base}.logic", os.path.join(_project_dir, "logic")),
         (f"{_base}.utils", os.path.join(_project_dir, "utils")),
+        (f"{_base}.ui", os.path.join(_project_dir, "ui")),
     ]:
         _mod = types.ModuleType(_name)
         _mod.__path__ = [_path]
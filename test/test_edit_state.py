@@ -0,0 +1,71 @@
+import sys
+
+import pytest
+
+# EditState imports the configuration, which needs the jp_text_processing submodule
+edit_state = pytest.importorskip("_anki_addon.ui.edit_state")
+
+from _anki_addon.configuration import COPY_MODE_ACROSS_NOTES, COPY_MODE_WITHIN_NOTE
+from _anki_addon.logic.interpolate_fields import SOURCE_NOTE_DATA_KEY
+
+MODELS = [
+    {"id": 1, "name": "Basic", "tmpls": [], "type": 0},
+    {"id": 2, "name": "Vocab", "tmpls": [], "type": 0},
+]
+
+
+@pytest.fixture
+def mw():
+    mw = sys.modules["aqt"].mw
+    mw.reset_mock()
+    mw.col.models.all.return_value = MODELS
+    mw.col.models.get.side_effect = lambda mid: next(m for m in MODELS if m["id"] == mid)
+    mw.col.models.field_names.return_value = ["Front", "Back"]
+    mw.col.db.list.return_value = []
+    return mw
+
+
+def make_state(copy_mode, copy_into_note_types='"Basic"'):
+    return edit_state.EditState(
+        {
+            "copy_mode": copy_mode,
+            "definition_name": "Test",
+            "copy_into_note_types": copy_into_note_types,
+        }
+    )
+
+
+class TestUpdateCopyMode:
+    def test_switching_mode_rebuilds_options(self, mw):
+        state = make_state(COPY_MODE_ACROSS_NOTES)
+        assert SOURCE_NOTE_DATA_KEY in state.post_query_menu_options_dict
+
+        # Note types are unchanged, only the mode switches
+        state.update_copy_mode(COPY_MODE_WITHIN_NOTE)
+        assert SOURCE_NOTE_DATA_KEY not in state.post_query_menu_options_dict
+        assert "Basic" in state.post_query_menu_options_dict
+
+        state.update_copy_mode(COPY_MODE_ACROSS_NOTES)
+        assert SOURCE_NOTE_DATA_KEY in state.post_query_menu_options_dict
+
+    def test_switching_mode_calls_selected_model_callbacks(self, mw):
+        state = make_state(COPY_MODE_ACROSS_NOTES)
+        calls = []
+        state.add_selected_model_callback(lambda: calls.append(state.copy_mode), is_visible=True)
+
+        state.update_copy_mode(COPY_MODE_WITHIN_NOTE)
+        # Setting the same mode again shouldn't run the callbacks
+        state.update_copy_mode(COPY_MODE_WITHIN_NOTE)
+        assert calls == [COPY_MODE_WITHIN_NOTE]
+
+
+class TestUpdateModels:
+    def test_reordered_selection_is_updated(self, mw):
+        state = make_state(COPY_MODE_WITHIN_NOTE, '"Basic", "Vocab"')
+        state.copy_into_note_types = '"Vocab", "Basic"'
+        state.update_models()
+        assert [model["name"] for model in state.selected_models] == ["Vocab", "Basic"]
+
+    def test_unquoted_names_are_selected(self, mw):
+        state = make_state(COPY_MODE_WITHIN_NOTE, 'Basic, "Vocab')
+        assert [model["name"] for model in state.selected_models] == ["Basic", "Vocab"]
@@ -0,0 +1,29 @@
+import re
+
+import pytest
+
+from _anki_addon.logic import regex_process as regex_process_module
+from _anki_addon.logic.regex_process import get_piped_flags, regex_process
+
+
+class TestGetPipedFlags:
+    @pytest.mark.parametrize(
+        "flags, expected",
+        [
+            # Single flag
+            ("IGNORECASE", re.IGNORECASE),
+            # Combination, as joined by the flags MultiComboBox
+            ("IGNORECASE, DOTALL", re.IGNORECASE | re.DOTALL),
+            ("ASCII, VERBOSE, MULTILINE", re.ASCII | re.VERBOSE | re.MULTILINE),
+        ],
+    )
+    def test_get_piped_flags(self, flags, expected):
+        assert get_piped_flags(flags) == expected
+
+    @pytest.mark.parametrize("flags", ["", None])
+    def test_empty_flags_are_not_parsed(self, flags, monkeypatch):
+        def fail(_flags):
+            raise AssertionError("get_piped_flags shouldn't be called without flags")
+
+        monkeypatch.setattr(regex_process_module, "get_piped_flags", fail)
+        assert regex_process("Foo foo", "foo", "bar", flags) == "Foo bar"
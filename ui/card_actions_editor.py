@@ -187,8 +187,7 @@ class CardActionsEditor(QWidget):
         ):
             # in this mode, card actions apply to destination notes' cards so show all card types
             # from all existing note types
-            all_note_types = mw.col.models.all()
-            for model in all_note_types:
+            for model in self.state.all_models:
                 model_name = model["name"]
                 templates = model.get("tmpls", [])
 
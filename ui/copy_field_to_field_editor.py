@@ -426,10 +426,10 @@ class CopyFieldToFieldEditor(QWidget):
         Returns the list of field-to-field definitions from the current state of the editor.
         """
         field_to_field_defs = []
+        # Check the direction from state rather than the checkbox's enabled state, as the
+        # checkbox is only disabled once the tab has been shown
+        allow_unfocus_when_add = self.state.copy_direction != DIRECTION_SOURCE_TO_DESTINATIONS
         for copy_field_inputs in self.copy_field_inputs:
-            copy_on_unfocus_when_add = cast(
-                QCheckBox, copy_field_inputs["copy_on_unfocus_when_add"]
-            )
             copy_field_definition = {
                 "copy_into_note_field": copy_field_inputs["copy_into_note_field"].currentText(),
                 "copy_from_text": copy_field_inputs["copy_from_text"].get_text(),
@@ -440,7 +440,8 @@ class CopyFieldToFieldEditor(QWidget):
                     copy_field_inputs["copy_on_unfocus_when_edit"].isChecked()
                 ),
                 "copy_on_unfocus_when_add": (
-                    copy_on_unfocus_when_add.isChecked() and (copy_on_unfocus_when_add.isEnabled())
+                    copy_field_inputs["copy_on_unfocus_when_add"].isChecked()
+                    and allow_unfocus_when_add
                 ),
                 "copy_on_unfocus_trigger_field": (
                     copy_field_inputs["copy_on_unfocus_trigger_field"].currentText()
@@ -577,7 +578,7 @@ class CopyFieldToFieldEditor(QWidget):
         else:
             # Options are based on the possible note types defined by the card_query search in
             # crossNotesCopyEditor, however we'll just make it all fields in all note types for now
-            for model in mw.col.models.all():
+            for model in self.state.all_models:
                 field_target_cbox.addGroup(model["name"])
                 for field_name in mw.col.models.field_names(model):
                     if field_name == previous_text:
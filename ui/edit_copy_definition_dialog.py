@@ -1,10 +1,8 @@
-from contextlib import suppress
 from typing import Callable, Optional, Union, Tuple, cast
 import uuid
+from itertools import islice
 
 
-from aqt import mw
-
 from aqt.qt import (
     QWidget,
     QVBoxLayout,
@@ -14,13 +12,14 @@ from aqt.qt import (
     QSpacerItem,
     QTabWidget,
     QSizePolicy,
+    QStandardItemModel,
     QFormLayout,
     QLineEdit,
     QPushButton,
-    QGridLayout,
     QCheckBox,
     QIntValidator,
     QGuiApplication,
+    QTimer,
     Qt,
     qtmajor,
 )
@@ -34,7 +33,7 @@ from .copy_field_to_file_editor import CopyFieldToFileEditor
 from .field_to_variable_editor import CopyFieldToVariableEditor
 from .tag_editor import TagEditor
 from .card_actions_editor import CardActionsEditor
-from .grouped_combo_box import GroupedComboBox
+from .grouped_combo_box import GroupedComboBox, build_grouped_model
 from .interpolated_text_edit import InterpolatedTextEditLayout
 from .required_combobox import RequiredCombobox
 from .required_text_input import RequiredLineEdit
@@ -51,14 +50,17 @@ from ..configuration import (
     DirectionType,
     SelectCardByType,
     SELECT_CARD_BY_VALUES,
+    SELECT_CARD_BY_VALUE_SET,
 )
 from ..logic.interpolate_fields import (
     intr_format,
 )
 from ..utils.block_signals import block_signals
+from ..utils.updates_disabled import updates_disabled
 
 if qtmajor > 5:
     WindowModal = Qt.WindowModality.WindowModal
+    WA_DeleteOnClose = Qt.WidgetAttribute.WA_DeleteOnClose
     QSizePolicyFixed = QSizePolicy.Policy.Fixed
     QSizePolicyPreferred = QSizePolicy.Policy.Preferred
     QSizePolicyMinimum = QSizePolicy.Policy.Minimum
@@ -67,6 +69,7 @@ if qtmajor > 5:
     QAlignCenter = Qt.AlignmentFlag.AlignCenter
 else:
     WindowModal = Qt.WindowModal  # type: ignore
+    WA_DeleteOnClose = Qt.WA_DeleteOnClose  # type: ignore
     QSizePolicyFixed = QSizePolicy.Fixed  # type: ignore
     QSizePolicyPreferred = QSizePolicy.Preferred  # type: ignore
     QSizePolicyMinimum = QSizePolicy.Minimum  # type: ignore
@@ -75,16 +78,76 @@ else:
     QAlignCenter = Qt.AlignCenter  # type: ignore
 
 
+MULTIPLE_NOTE_TYPES_WARNING = (
+    "When selecting multiple note types, only the fields that are common to all"
+    + " note types will be available as destinations."
+)
+MULTIPLE_CARD_TYPES_WARNING_START = """<br><span style='color: orange'>WARNING:</span>
+                The following note types have multiple card types.
+                Only the first one will be used when applying special card values:
+                <ul>"""
+
+CARDS_BELONG_TO_DECKS_LABEL_HTML = """<small>Cards belong to decks, not notes.<br>
+        If your note type has multiple card types, the whitelisting applies to the note,<rb>
+        if any of its cards belong to a whitelisted deck.</small>"""
+
+CONDITION_QUERY_DESCRIPTION_HTML = f"""<ul>
+            <li>Use the same query syntax as in the card/note browser</li>
+            <li>Reference the trigger notes' fields with {intr_format('Field Name')}.</li>
+            <li>You can use card properties as well, e.g. prop:ivl, is:learn etc.</li>
+            <li>Right-click to select a {intr_format('Field Name')} or special values to paste</li>
+            <li>Matching the trigger note's id will automatically include it in the query.</li>
+            </ul>"""
+
+SEARCH_QUERY_DESCRIPTION_HTML = f"""<ul>
+            <li>Use the same query syntax as in the card/note browser</li>
+            <li>Reference the destination notes' fields with {intr_format('Field Name')}.</li>
+            <li>You can reference variables that you created in the Variables tab</li>
+            <li>Right-click to select a {intr_format('Field Name')} or special values to paste</li>
+            </ul>"""
+
+# How long to wait after the last keystroke before applying a changed card select count
+CARD_SELECT_COUNT_DELAY_MS = 200
+
+# Shared by the card select count inputs of all dialogs. Created on first use, as Qt may not
+# be ready yet when this module is imported
+card_select_count_validator: Optional[QIntValidator] = None
+
+
+def get_card_select_count_validator() -> QIntValidator:
+    global card_select_count_validator
+    if card_select_count_validator is None:
+        # Validate that the input is a positive integer, or 0 for all
+        card_select_count_validator = QIntValidator(0, 999)
+    return card_select_count_validator
+
+
+# The grouped note type fields model for the sort-by-field combobox, keyed by the note types' ids
+# and modification times, so it's only rebuilt when note types have changed between dialog opens.
+# The model is not parented to any combobox so that it outlives the dialog that created it.
+sort_by_field_model_cache: dict[
+    tuple, tuple[QStandardItemModel, dict[str, list[str]], int]
+] = {}
+
+
 def set_size_policy_for_all_widgets(layout, h_policy, v_policy):
-    for i in range(layout.count()):
-        widget = layout.itemAt(i).widget()
-        if widget:
-            widget.setSizePolicy(h_policy, v_policy)
-        else:
-            # If it's not a widget, it might be another layout, so we recurse
-            inner_layout = layout.itemAt(i).layout()
-            if inner_layout:
-                set_size_policy_for_all_widgets(inner_layout, h_policy, v_policy)
+    """
+    Sets the size policy for the widgets in the layout and in any nested layouts. The children of
+    those widgets are not touched, which is why this doesn't just use findChildren().
+    """
+    layouts = [layout]
+    while layouts:
+        current_layout = layouts.pop()
+        for i in range(current_layout.count()):
+            item = current_layout.itemAt(i)
+            widget = item.widget()
+            if widget:
+                widget.setSizePolicy(h_policy, v_policy)
+            else:
+                # If it's not a widget, it might be another layout, so we go through it too
+                inner_layout = item.layout()
+                if inner_layout:
+                    layouts.append(inner_layout)
 
 
 class BasicEditorFormLayout(QFormLayout):
@@ -102,124 +165,119 @@ class BasicEditorFormLayout(QFormLayout):
         extra_top_widgets: Optional[list[Tuple[QLabel, QWidget]]] = None,
     ):
         super().__init__(parent)
+        # Hold off repainting the parent until all the rows have been added, so that each addRow
+        # doesn't cause its own layout pass
+        with updates_disabled(parent):
+            self.copy_definition = copy_definition
+            self.state = state
+            self.get_condition_query_editor = get_condition_query_editor
+
+            self.definition_name_edit = RequiredLineEdit(is_required=True)
+            self.addRow(QLabel("<h3>Name for this copy definition</h3>"), self.definition_name_edit)
+            # Set the initial definition name from the state
+            if state.definition_name:
+                self.definition_name_edit.setText(state.definition_name)
+                self.definition_name_edit.update_required_style()
+            # link the definition name to the state
+            state.connect_definition_name_editor(self.definition_name_edit)
+
+            if extra_top_widgets:
+                for label, widget in extra_top_widgets:
+                    self.addRow(label, widget)
+                spacer = QSpacerItem(100, 20, QSizePolicyExpanding, QSizePolicyMinimum)
+                self.addItem(spacer)
+
+            self.note_type_target_cbox = MultiComboBox(
+                placeholder_text="Select note types",
+                is_required=True,
+            )
+            self.note_type_target_cbox.setMinimumWidth(300)
+            self.note_type_target_cbox.addItems(list(state.models_by_quoted_name))
+            self.target_note_type_label = QLabel("<h3>Trigger (destination) note type</h3>")
+            self.addRow(self.target_note_type_label, self.note_type_target_cbox)
 
-        self.copy_definition = copy_definition
-        self.state = state
-        self.get_condition_query_editor = get_condition_query_editor
-
-        # Get the names of all the decks
-        model_names_list = []
-        for model in mw.col.models.all_names_and_ids():
-            model_names_list.append(model.name)
-
-        self.definition_name_edit = RequiredLineEdit(is_required=True)
-        self.addRow(QLabel("<h3>Name for this copy definition</h3>"), self.definition_name_edit)
-        # Set the initial definition name from the state
-        if state.definition_name:
-            self.definition_name_edit.setText(state.definition_name)
-            self.definition_name_edit.update_required_style()
-        # link the definition name to the state
-        state.connect_definition_name_editor(self.definition_name_edit)
-
-        if extra_top_widgets:
-            for label, widget in extra_top_widgets:
-                self.addRow(label, widget)
-            spacer = QSpacerItem(100, 20, QSizePolicyExpanding, QSizePolicyMinimum)
-            self.addItem(spacer)
+            # Set up a label for showing a warning, if selecting multiple models
+            self.note_type_target_warning = QLabel("")
+            self.addRow("", self.note_type_target_warning)
 
-        self.note_type_target_cbox = MultiComboBox(
-            placeholder_text="Select note types",
-            is_required=True,
-        )
-        self.note_type_target_cbox.setMinimumWidth(300)
-        # Wrap name in "" to avoid issues with commas in the name
-        self.note_type_target_cbox.addItems([f'"{model_name}"' for model_name in model_names_list])
-        self.target_note_type_label = QLabel("<h3>Trigger (destination) note type</h3>")
-        self.addRow(self.target_note_type_label, self.note_type_target_cbox)
-
-        # Set up a label for showing a warning, if selecting multiple models
-        self.note_type_target_warning = QLabel("")
-        self.addRow("", self.note_type_target_warning)
-
-        self.decks_limit_multibox = MultiComboBox(
-            placeholder_text="First, select a trigger note type"
-        )
-        self.decks_limit_multibox.setMinimumWidth(300)
-        self.decks_init_done = False
-        self.deck_limit_label = QLabel("<h4>Trigger (destination) deck limit</h4>")
-        self.addRow(self.deck_limit_label, self.decks_limit_multibox)
-        self.addRow(
-            "",
-            QLabel("""<small>Cards belong to decks, not notes.<br>
-        If your note type has multiple card types, the whitelisting applies to the note,<rb>
-        if any of its cards belong to a whitelisted deck.</small>"""),
-        )
-        state.connect_only_copy_into_decks_editor(
-            self.decks_limit_multibox,
-            self.update_deck_multibox_options,
-        )
+            self.decks_limit_multibox = MultiComboBox(
+                placeholder_text="First, select a trigger note type"
+            )
+            self.decks_limit_multibox.setMinimumWidth(300)
+            self.decks_init_done = False
+            self.deck_limit_label = QLabel("<h4>Trigger (destination) deck limit</h4>")
+            self.addRow(self.deck_limit_label, self.decks_limit_multibox)
+            self.addRow(
+                "",
+                QLabel(CARDS_BELONG_TO_DECKS_LABEL_HTML),
+            )
+            state.connect_only_copy_into_decks_editor(
+                self.decks_limit_multibox,
+                self.update_deck_multibox_options,
+            )
 
-        # Register callbacks that should be called when note types change
-        # This includes both the warning and deck options update
-        # The callback needs to be registered for model changes to update deck options
-        state.connect_target_note_type_editor(
-            self.note_type_target_cbox,
-            self.set_note_type_warning,
-        )
+            # Register callbacks that should be called when note types change
+            # This includes both the warning and deck options update
+            # The callback needs to be registered for model changes to update deck options
+            state.connect_target_note_type_editor(
+                self.note_type_target_cbox,
+                self.set_note_type_warning,
+            )
 
-        # Add a callback to update deck options when models change
-        state.add_selected_model_callback(self.update_deck_multibox_options, is_visible=True)
+            # Add a callback to update deck options when models change
+            state.add_selected_model_callback(self.update_deck_multibox_options, is_visible=True)
 
-        self.include_subdecks_checkbox = QCheckBox("Include subdecks of selected decks")
-        self.include_subdecks_checkbox.setChecked(False)
-        self.addRow("", self.include_subdecks_checkbox)
-        self.state.connect_include_subdecks_checkbox(self.include_subdecks_checkbox)
+            self.include_subdecks_checkbox = QCheckBox("Include subdecks of selected decks")
+            self.include_subdecks_checkbox.setChecked(False)
+            self.addRow("", self.include_subdecks_checkbox)
+            self.state.connect_include_subdecks_checkbox(self.include_subdecks_checkbox)
 
-        spacer = QSpacerItem(100, 20, QSizePolicyExpanding, QSizePolicyMinimum)
-        self.addItem(spacer)
-
-        self.copy_on_sync_checkbox = QCheckBox("Run on sync for reviewed cards")
-        self.copy_on_sync_checkbox.setChecked(False)
-        self.addRow("", self.copy_on_sync_checkbox)
-
-        def update_condition_only_on_sync_checkbox():
-            # get the condition_query_tab_widget from the parent
-            condition_query_tab_widget = self.get_condition_query_editor()
-            if condition_query_tab_widget is None:
-                # Widget hasn't been created yet, so nothing to update
-                return
-            # enable or disable the condition_only_on_sync_checkbox based on copy_on_sync_checkbox
-            if self.state.copy_on_sync:
-                condition_query_tab_widget.condition_only_on_sync_checkbox.setEnabled(True)
-                # Unset the tooltip
-                condition_query_tab_widget.condition_only_on_sync_checkbox.setToolTip("")
-            else:
-                condition_query_tab_widget.condition_only_on_sync_checkbox.setEnabled(False)
-                condition_query_tab_widget.condition_only_on_sync_checkbox.setToolTip(
-                    "This option is only available when 'Run on sync for reviewed cards' is enabled"
-                    " in Basic Settings"
-                )
+            spacer = QSpacerItem(100, 20, QSizePolicyExpanding, QSizePolicyMinimum)
+            self.addItem(spacer)
 
-        self.copy_on_sync_checkbox_callback = state.add_copy_on_sync_callback(
-            update_condition_only_on_sync_checkbox, is_visible=True
-        )
+            self.copy_on_sync_checkbox = QCheckBox("Run on sync for reviewed cards")
+            self.copy_on_sync_checkbox.setChecked(False)
+            self.addRow("", self.copy_on_sync_checkbox)
+
+            def update_condition_only_on_sync_checkbox():
+                # get the condition_query_tab_widget from the parent
+                condition_query_tab_widget = self.get_condition_query_editor()
+                if condition_query_tab_widget is None:
+                    # Widget hasn't been created yet, so nothing to update
+                    return
+                # enable or disable the condition_only_on_sync_checkbox based on
+                # copy_on_sync_checkbox
+                if self.state.copy_on_sync:
+                    condition_query_tab_widget.condition_only_on_sync_checkbox.setEnabled(True)
+                    # Unset the tooltip
+                    condition_query_tab_widget.condition_only_on_sync_checkbox.setToolTip("")
+                else:
+                    condition_query_tab_widget.condition_only_on_sync_checkbox.setEnabled(False)
+                    condition_query_tab_widget.condition_only_on_sync_checkbox.setToolTip(
+                        "This option is only available when 'Run on sync for reviewed cards' is"
+                        " enabled in Basic Settings"
+                    )
+
+            self.copy_on_sync_checkbox_callback = state.add_copy_on_sync_callback(
+                update_condition_only_on_sync_checkbox, is_visible=True
+            )
 
-        state.connect_copy_on_sync_checkbox(self.copy_on_sync_checkbox)
+            state.connect_copy_on_sync_checkbox(self.copy_on_sync_checkbox)
 
-        self.copy_on_add_checkbox = QCheckBox("Run when adding new note")
-        self.copy_on_add_checkbox.setChecked(False)
-        self.addRow("", self.copy_on_add_checkbox)
-        state.connect_copy_on_add_checkbox(self.copy_on_add_checkbox)
+            self.copy_on_add_checkbox = QCheckBox("Run when adding new note")
+            self.copy_on_add_checkbox.setChecked(False)
+            self.addRow("", self.copy_on_add_checkbox)
+            state.connect_copy_on_add_checkbox(self.copy_on_add_checkbox)
 
-        self.copy_on_review_checkbox = QCheckBox("Run on review")
-        self.copy_on_review_checkbox.setChecked(False)
-        self.addRow("", self.copy_on_review_checkbox)
-        state.connect_copy_on_review_checkbox(self.copy_on_review_checkbox)
+            self.copy_on_review_checkbox = QCheckBox("Run on review")
+            self.copy_on_review_checkbox.setChecked(False)
+            self.addRow("", self.copy_on_review_checkbox)
+            state.connect_copy_on_review_checkbox(self.copy_on_review_checkbox)
 
-        spacer = QSpacerItem(100, 40, QSizePolicyExpanding, QSizePolicyMinimum)
-        self.addItem(spacer)
+            spacer = QSpacerItem(100, 40, QSizePolicyExpanding, QSizePolicyMinimum)
+            self.addItem(spacer)
 
-        self.init_ui_from_state()
+            self.init_ui_from_state()
 
     def update_direction_labels(self, direction):
         if direction == DIRECTION_SOURCE_TO_DESTINATIONS:
@@ -230,13 +288,16 @@ class BasicEditorFormLayout(QFormLayout):
         self.deck_limit_label.setText(f"<h4>Trigger ({target_type}) deck limit</h4>")
 
     def init_ui_from_state(self):
-        self.note_type_target_cbox.setCurrentText(self.state.copy_into_note_types)
+        # The state already has these values, so block the change signals which would otherwise
+        # sync them back into the state and run the note type and deck updates again for each
+        # editor. The warning and deck options are updated once below instead.
+        with block_signals(self.note_type_target_cbox, self.decks_limit_multibox):
+            self.note_type_target_cbox.setCurrentText(self.state.copy_into_note_types)
+            self.decks_limit_multibox.setCurrentText(self.state.only_copy_into_decks)
         self.note_type_target_cbox.update_required_style()
-        # self.note_type_target_cbox.update_required_style()
         self.copy_on_sync_checkbox.setChecked(self.state.copy_on_sync)
         self.copy_on_add_checkbox.setChecked(self.state.copy_on_add)
         self.copy_on_review_checkbox.setChecked(self.state.copy_on_review)
-        self.decks_limit_multibox.setCurrentText(self.state.only_copy_into_decks)
         self.include_subdecks_checkbox.setChecked(self.state.include_subdecks)
         self.update_direction_labels(self.state.copy_direction)
         self.set_note_type_warning()
@@ -244,37 +305,32 @@ class BasicEditorFormLayout(QFormLayout):
 
     def set_note_type_warning(self):
         if len(self.state.selected_models) > 1:
-            text = (
-                "When selecting multiple note types, only the fields that are common to all"
-                + " note types will be available as destinations."
-            )
             # Check that each model has a single card template only
-            models_first_templates = []
-            for model in self.state.selected_models:
-                if len(model["tmpls"]) > 1:
-                    models_first_templates.append((model["name"], model["tmpls"][0]["name"]))
+            models_first_templates = "".join(
+                f"<li>{model['name']}: {model['tmpls'][0]['name']}</li>"
+                for model in self.state.selected_models
+                if len(model["tmpls"]) > 1
+            )
             if models_first_templates:
-                text += """<br><span style='color: orange'>WARNING:</span>
-                The following note types have multiple card types.
-                Only the first one will be used when applying special card values:
-                <ul>"""
-                for model_name, template_name in models_first_templates:
-                    text += f"<li>{model_name}: {template_name}</li>"
-                text += "</ul>"
+                text = (
+                    f"{MULTIPLE_NOTE_TYPES_WARNING}{MULTIPLE_CARD_TYPES_WARNING_START}"
+                    f"{models_first_templates}</ul>"
+                )
+            else:
+                text = MULTIPLE_NOTE_TYPES_WARNING
             self.note_type_target_warning.setText(text)
         else:
             self.note_type_target_warning.setText("")
 
     def update_deck_multibox_options(self):
-        self.decks_limit_multibox.blockSignals(True)
-        self.decks_limit_multibox.clear()
-        for deck in self.state.all_decks:
-            # Wrap name in "" to avoid issues with commas in the name
-            self.decks_limit_multibox.addItem(f'"{deck["name"]}"')
-            if deck["name"] in self.state.current_deck_names:
-                self.decks_limit_multibox.addSelectedItem(f'"{deck["name"]}"')
-        self.decks_limit_multibox.set_popup_and_box_width()
-        self.decks_limit_multibox.blockSignals(False)
+        with block_signals(self.decks_limit_multibox):
+            self.decks_limit_multibox.setUpdatesEnabled(False)
+            self.decks_limit_multibox.clear()
+            self.decks_limit_multibox.addItems(self.state.quoted_deck_names)
+            for deck_name in self.state.quoted_current_deck_names:
+                self.decks_limit_multibox.addSelectedItem(deck_name)
+            self.decks_limit_multibox.set_popup_and_box_width()
+            self.decks_limit_multibox.setUpdatesEnabled(True)
 
         # Update placeholder text
         if len(self.state.selected_models) == 0:
@@ -312,13 +368,7 @@ class ConditionQueryTabWidget(QWidget):
             label=self.condition_query_text_label,
             # No special fields for search, just the destination note fields will be used
             options_dict={},
-            description=f"""<ul>
-            <li>Use the same query syntax as in the card/note browser</li>
-            <li>Reference the trigger notes' fields with {intr_format('Field Name')}.</li>
-            <li>You can use card properties as well, e.g. prop:ivl, is:learn etc.</li>
-            <li>Right-click to select a {intr_format('Field Name')} or special values to paste</li>
-            <li>Matching the trigger note's id will automatically include it in the query.</li>
-            </ul>""",
+            description=CONDITION_QUERY_DESCRIPTION_HTML,
             height=100,
             placeholder_text='"tag:Some tag" prop:reps>0 -is:suspended',
         )
@@ -350,12 +400,14 @@ class ConditionQueryTabWidget(QWidget):
         query_layout.addSpacerItem(spacer)
         # Set the current text in the combo boxes to what we had in memory in the configuration
         if copy_definition:
-            with suppress(KeyError):
-                self.condition_query_text_layout.set_text(copy_definition["copy_condition_query"])
-            with suppress(KeyError):
-                self.condition_only_on_sync_checkbox.setChecked(
-                    copy_definition.get("condition_only_on_sync", False)
-                )
+            copy_condition_query = copy_definition.get("copy_condition_query")
+            if copy_condition_query is not None:
+                # The text is validated once the options are set in initialize_ui_state
+                with block_signals(self.condition_query_text_layout.text_edit):
+                    self.condition_query_text_layout.set_text(copy_condition_query)
+            self.condition_only_on_sync_checkbox.setChecked(
+                copy_definition.get("condition_only_on_sync", False)
+            )
             if state.copy_on_sync:
                 self.condition_only_on_sync_checkbox.setEnabled(True)
             else:
@@ -387,8 +439,8 @@ class ConditionQueryTabWidget(QWidget):
         options_dict.update(self.state.variables_dict)
         validate_dict = self.state.pre_query_text_edit_validate_dict.copy()
         validate_dict.update(self.state.variables_validate_dict)
+        # update_options validates the text too
         self.condition_query_text_layout.update_options(options_dict, validate_dict)
-        self.condition_query_text_layout.validate_text()
 
 
 class AcrossQueryTabWidget(QWidget):
@@ -415,12 +467,7 @@ class AcrossQueryTabWidget(QWidget):
             is_required=True,
             # No special fields for search, just the destination note fields will be used
             options_dict={},
-            description=f"""<ul>
-            <li>Use the same query syntax as in the card/note browser</li>
-            <li>Reference the destination notes' fields with {intr_format('Field Name')}.</li>
-            <li>You can reference variables that you created in the Variables tab</li>
-            <li>Right-click to select a {intr_format('Field Name')} or special values to paste</li>
-            </ul>""",
+            description=SEARCH_QUERY_DESCRIPTION_HTML,
             height=100,
             placeholder_text=(
                 f'"deck:My deck" "A Different Field:*{intr_format("Field_Name")}*" -is:suspended'
@@ -447,13 +494,7 @@ class AcrossQueryTabWidget(QWidget):
 
         self.sort_by_field_cbox = GroupedComboBox(is_required=False)
         query_form.addRow("<h4>Sort queried notes by field</h4>", self.sort_by_field_cbox)
-        # Add all fields from all note types
-        self.sort_by_field_cbox.addItem("-")
-        self.sort_by_field_cbox.setCurrentText("-")
-        for model in mw.col.models.all():
-            self.sort_by_field_cbox.addGroup(model["name"])
-            for field in model["flds"]:
-                self.sort_by_field_cbox.addItemToGroup(model["name"], field["name"])
+        self.init_sort_by_field_options()
 
         self.card_select_hbox = QHBoxLayout()
         self.card_select_cbox = RequiredCombobox()
@@ -468,8 +509,7 @@ class AcrossQueryTabWidget(QWidget):
 
         card_select_count_hbox = QHBoxLayout()
         self.card_select_count = QLineEdit()
-        # Validate that the input is a positive integer, or 0 for all
-        self.card_select_count.setValidator(QIntValidator(0, 999))
+        self.card_select_count.setValidator(get_card_select_count_validator())
         self.card_select_count.setMaxLength(3)
         self.card_select_count.setFixedWidth(60)
         self.card_select_count.setText("1")
@@ -479,7 +519,14 @@ class AcrossQueryTabWidget(QWidget):
         card_select_count_hbox.addStretch(1)
         query_form.addRow("<h5>Select multiple cards? (set 0 for all)</h5>", card_select_count_hbox)
 
-        self.card_select_count.textChanged.connect(self.on_card_select_count_changed)
+        # Refresh once typing has paused, so that clearing the input, which leaves it in an
+        # intermediate state that doesn't emit editingFinished, is handled too
+        self.card_select_count_timer = QTimer(self)
+        self.card_select_count_timer.setSingleShot(True)
+        self.card_select_count_timer.setInterval(CARD_SELECT_COUNT_DELAY_MS)
+        self.card_select_count_timer.timeout.connect(self.apply_card_select_count)
+        self.card_select_count.textChanged.connect(lambda: self.card_select_count_timer.start())
+        self.card_select_count.editingFinished.connect(self.apply_card_select_count)
 
         self.card_select_separator = RequiredLineEdit()
         self.card_select_separator.setText(", ")
@@ -496,25 +543,59 @@ class AcrossQueryTabWidget(QWidget):
         # Set the current text in the combo boxes to what we had in memory in the configuration
         # (if we had something)
         if copy_definition:
-            with suppress(KeyError):
-                self.card_query_text_layout.set_text(copy_definition["copy_from_cards_query"])
-            with suppress(KeyError):
-                self.sort_by_field_cbox.setCurrentText(copy_definition["sort_by_field"])
-            with suppress(KeyError):
-                self.card_select_cbox.setCurrentText(copy_definition["select_card_by"])
-            with suppress(KeyError):
-                self.card_select_count.setText(copy_definition["select_card_count"])
-            with suppress(KeyError):
-                self.card_select_separator.setText(copy_definition["select_card_separator"])
-            with suppress(KeyError):
-                self.show_error_for_none_found.setChecked(
-                    copy_definition.get("show_error_if_none_found", False)
-                )
-            with suppress(KeyError):
-                self.run_also_if_no_sources_found_checkbox.setChecked(
-                    copy_definition.get("run_also_if_no_sources_found", False)
-                )
+            copy_from_cards_query = copy_definition.get("copy_from_cards_query")
+            if copy_from_cards_query is not None:
+                # The text is validated once the options are set in initialize_ui_state
+                with block_signals(self.card_query_text_layout.text_edit):
+                    self.card_query_text_layout.set_text(copy_from_cards_query)
+            for key, set_value in (
+                ("sort_by_field", self.sort_by_field_cbox.setCurrentText),
+                ("select_card_by", self.card_select_cbox.setCurrentText),
+                ("select_card_count", self.card_select_count.setText),
+                ("select_card_separator", self.card_select_separator.setText),
+            ):
+                value = copy_definition.get(key)
+                if value is not None:
+                    set_value(value)
+            self.show_error_for_none_found.setChecked(
+                copy_definition.get("show_error_if_none_found", False)
+            )
+            self.run_also_if_no_sources_found_checkbox.setChecked(
+                copy_definition.get("run_also_if_no_sources_found", False)
+            )
             self.update_run_also_if_no_sources_found_checkbox(self.state.copy_direction)
+        # Apply the initial value right away instead of waiting for the timer
+        self.apply_card_select_count()
+
+    def init_sort_by_field_options(self):
+        """
+        Adds all fields from all note types to the sort-by-field combobox, reusing the model
+        built on a previous dialog open if the note types haven't changed since.
+        """
+        cache_key = tuple((model["id"], model["mod"]) for model in self.state.all_models)
+        cached = sort_by_field_model_cache.get(cache_key)
+        if cached is None:
+            groups = {
+                model["name"]: [field["name"] for field in model["flds"]]
+                for model in self.state.all_models
+            }
+            font_metrics = self.sort_by_field_cbox.view().fontMetrics()
+            max_width = max(
+                (
+                    font_metrics.boundingRect(text).width()
+                    for group_name, field_names in groups.items()
+                    for text in (group_name, *field_names)
+                ),
+                default=0,
+            )
+            # Only keep the latest model
+            sort_by_field_model_cache.clear()
+            cached = (build_grouped_model(groups, ["-"]), groups, max_width)
+            sort_by_field_model_cache[cache_key] = cached
+        model, groups, max_width = cached
+        self.sort_by_field_cbox.setGroupedModel(model, groups)
+        self.sort_by_field_cbox.update_max_width(max_width)
+        self.sort_by_field_cbox.setCurrentText("-")
 
     def update_run_also_if_no_sources_found_checkbox(self, direction: DirectionType):
         if direction == DIRECTION_SOURCE_TO_DESTINATIONS:
@@ -526,6 +607,10 @@ class AcrossQueryTabWidget(QWidget):
             self.run_also_if_no_sources_found_checkbox.setEnabled(True)
             self.run_also_if_no_sources_found_checkbox.setToolTip("")
 
+    def apply_card_select_count(self):
+        self.card_select_count_timer.stop()
+        self.on_card_select_count_changed(self.card_select_count.text())
+
     # If card_select_count is > 1, separator is required, otherwise it's ok to be empty
     def on_card_select_count_changed(self, text: str):
         if (
@@ -587,8 +672,8 @@ class AcrossQueryTabWidget(QWidget):
         options_dict.update(self.state.variables_dict)
         validate_dict = self.state.pre_query_text_edit_validate_dict.copy()
         validate_dict.update(self.state.variables_validate_dict)
+        # update_options validates the text too
         self.card_query_text_layout.update_options(options_dict, validate_dict)
-        self.card_query_text_layout.validate_text()
 
 
 class TabEditorComponents(QTabWidget):
@@ -696,9 +781,6 @@ class TabEditorComponents(QTabWidget):
         variables_layout.addItem(spacer)
         set_size_policy_for_all_widgets(variables_layout, QSizePolicyPreferred, QSizePolicyFixed)
 
-        # Initialize the editor's UI state
-        self.field_to_variable_editor.initialize_ui_state()
-
         # Force the widget to update its size
         self.variables_widget.adjustSize()
         self.created_tabs.add("variables")
@@ -720,9 +802,6 @@ class TabEditorComponents(QTabWidget):
         fields_layout.addItem(spacer)
         set_size_policy_for_all_widgets(fields_layout, QSizePolicyPreferred, QSizePolicyFixed)
 
-        # Initialize the editor's UI state
-        self.field_to_field_editor.initialize_ui_state()
-
         # Force the widget to update its size
         self.fields_widget.adjustSize()
         self.created_tabs.add("fields")
@@ -841,10 +920,14 @@ class TabEditorComponents(QTabWidget):
             self.create_basic_tab()
         elif tab_text == "Variables":
             self.create_variables_tab()
+            # The editor may have been created earlier just for reading its definitions, so its
+            # options are only refreshed once the tab is actually shown
+            self.field_to_variable_editor.initialize_ui_state()
         elif tab_text == "Condition":
             self.create_condition_query_tab()
         elif tab_text == "Field to Field":
             self.create_fields_tab()
+            self.field_to_field_editor.initialize_ui_state()
         elif tab_text == "Tags":
             self.create_tags_tab()
         elif tab_text == "Card Actions":
@@ -1103,105 +1186,156 @@ class EditCopyDefinitionDialog(ScrollableQDialog):
         self.ok_button.clicked.connect(self.check_fields)
         self.close_button.clicked.connect(self.reject)
 
-        self.bottom_grid = QGridLayout()
-        self.bottom_grid.setColumnMinimumWidth(0, 150)
-        self.bottom_grid.setColumnMinimumWidth(1, 150)
-        self.bottom_grid.setColumnMinimumWidth(2, 150)
+        self.bottom_buttons = QHBoxLayout()
+        self.bottom_buttons.addWidget(self.ok_button)
+        self.bottom_buttons.addStretch(1)
+        self.bottom_buttons.addWidget(self.close_button)
 
-        self.bottom_grid.addWidget(self.ok_button, 0, 0)
-        self.bottom_grid.addWidget(self.close_button, 0, 2)
-
-        super().__init__(parent, footer_layout=self.bottom_grid)
+        super().__init__(parent, footer_layout=self.bottom_buttons)
         self.copy_definition = copy_definition
         self.state = EditState(copy_definition)
+        # The definition is snapshotted here on save, since the dialog and all its child widgets
+        # get deleted once exec() returns
+        self.saved_copy_definition: Optional[CopyDefinition] = None
+        # The mode specific part of the copy definition for each copy mode
+        self.mode_dict_getters: dict[CopyModeType, Callable[[], dict]] = {
+            COPY_MODE_ACROSS_NOTES: self.get_across_notes_dict,
+            COPY_MODE_WITHIN_NOTE: self.get_within_note_dict,
+        }
 
         # Build form layout
         self.setWindowModality(WindowModal)
-        self.main_layout = QVBoxLayout(self.inner_widget)
-        self.top_form = QFormLayout()
-        self.main_layout.addLayout(self.top_form)
-
-        self.tabs_vbox = QVBoxLayout()
-        self.main_layout.addLayout(self.tabs_vbox)
-        self.selected_editor_type: CopyModeType = COPY_MODE_ACROSS_NOTES
-
-        self.editor_type_label = QLabel("<h2>Select copy type</h2>")
-        self.editor_type_label.setAlignment(QAlignCenter)
-        self.tabs_vbox.addWidget(self.editor_type_label)
-        self.editor_type_tabs = QTabWidget()
-        self.editor_type_tabs.setStyleSheet("""
-        QTabBar::tab {
-            font-size: 14px;
-            font-weight: bold;
-        }
-        """)
-
-        self.across_notes_editor_tab = AcrossNotesCopyEditor(self, self.state, copy_definition)
-        self.editor_type_tabs.addTab(self.across_notes_editor_tab, COPY_MODE_ACROSS_NOTES)
+        self.setAttribute(WA_DeleteOnClose, True)
+        # Don't repaint until all the tabs have been added and the initial editor created
+        with updates_disabled(self):
+            self.main_layout = QVBoxLayout(self.inner_widget)
+            self.top_form = QFormLayout()
+            self.main_layout.addLayout(self.top_form)
+
+            self.tabs_vbox = QVBoxLayout()
+            self.main_layout.addLayout(self.tabs_vbox)
+            self.selected_editor_type: CopyModeType = COPY_MODE_ACROSS_NOTES
+
+            self.editor_type_label = QLabel("<h2>Select copy type</h2>")
+            self.editor_type_label.setAlignment(QAlignCenter)
+            self.tabs_vbox.addWidget(self.editor_type_label)
+            self.editor_type_tabs = QTabWidget()
+            self.editor_type_tabs.setStyleSheet("""
+            QTabBar::tab {
+                font-size: 14px;
+                font-weight: bold;
+            }
+            """)
 
-        self.within_note_editor_tab = WithinNoteCopyEditor(self, self.state, copy_definition)
-        self.editor_type_tabs.addTab(self.within_note_editor_tab, COPY_MODE_WITHIN_NOTE)
+            # Create placeholder widgets for each copy mode, the actual editor is only created when
+            # its tab is first shown
+            self.across_notes_widget = QWidget()
+            self.within_note_widget = QWidget()
+            self.editor_type_tabs.addTab(self.across_notes_widget, COPY_MODE_ACROSS_NOTES)
+            self.editor_type_tabs.addTab(self.within_note_widget, COPY_MODE_WITHIN_NOTE)
+            self.across_notes_editor_tab: Optional[AcrossNotesCopyEditor] = None
+            self.within_note_editor_tab: Optional[WithinNoteCopyEditor] = None
 
-        self.active_field_to_field_editor = None
+            self.active_field_to_field_editor = None
 
-        self.tabs_vbox.addWidget(self.editor_type_tabs)
-        set_size_policy_for_all_widgets(self.tabs_vbox, QSizePolicyPreferred, QSizePolicyFixed)
+            self.tabs_vbox.addWidget(self.editor_type_tabs)
+            set_size_policy_for_all_widgets(self.tabs_vbox, QSizePolicyPreferred, QSizePolicyFixed)
 
-        # Connect the currentChanged signal to updateEditorType
-        self.editor_type_tabs.currentChanged.connect(self.update_editor_type)
+            # Connect the currentChanged signal to updateEditorType
+            self.editor_type_tabs.currentChanged.connect(self.update_editor_type)
 
-        # Set the initial tab based on copy_definition
-        if copy_definition:
-            with suppress(KeyError):
-                self.selected_editor_type = copy_definition["copy_mode"]
-                if self.selected_editor_type == COPY_MODE_ACROSS_NOTES:
+            # Set the initial tab based on copy_definition
+            # Block signals so that update_editor_type doesn't run twice, it's called explicitly
+            # below
+            copy_mode = copy_definition.get("copy_mode") if copy_definition else None
+            with block_signals(self.editor_type_tabs):
+                if copy_mode == COPY_MODE_ACROSS_NOTES:
+                    self.selected_editor_type = copy_mode
                     self.editor_type_tabs.setCurrentIndex(0)
-                elif self.selected_editor_type == COPY_MODE_WITHIN_NOTE:
+                elif copy_mode == COPY_MODE_WITHIN_NOTE:
+                    self.selected_editor_type = copy_mode
                     self.editor_type_tabs.setCurrentIndex(1)
 
-        # Trigger initial tab setup
-        self.update_editor_type(self.editor_type_tabs.currentIndex())
+            # Trigger initial tab setup
+            self.update_editor_type(self.editor_type_tabs.currentIndex())
+
+        # Size the dialog before it's first shown, so that it's centred at its final size.
+        # Activate the layout once now that updates are back on, so sizeHint() doesn't need to
+        self.layout().activate()
+        self.apply_initial_size()
 
+    def apply_initial_size(self):
         # Set dialog width window width
         screen = QGuiApplication.primaryScreen()
         if screen:
             available_geometry = screen.availableGeometry()
+            size_hint = self.sizeHint()
             self.resize(
-                max(self.sizeHint().width(), int(available_geometry.width() * 0.80)),
-                int(min(self.sizeHint().height() * 1.5, int(available_geometry.height()))),
+                max(size_hint.width(), int(available_geometry.width() * 0.80)),
+                int(min(size_hint.height() * 1.5, int(available_geometry.height()))),
             )
 
     def update_editor_type(self, index: int):
         if index == 0:
             self.selected_editor_type = COPY_MODE_ACROSS_NOTES
-            self.state.copy_mode = COPY_MODE_ACROSS_NOTES
+            # Rebuilds the mode dependent options, the new editor reads them from the state
+            self.state.update_copy_mode(COPY_MODE_ACROSS_NOTES)
             # Lazy access to the field editor
             self.active_field_to_field_editor = None
             # Init Basic tab in AcrossNotesCopyEditor
-            self.across_notes_editor_tab.editor_tabs.create_basic_tab()
+            self.get_across_notes_editor_tab().editor_tabs.create_basic_tab()
         elif index == 1:
             self.selected_editor_type = COPY_MODE_WITHIN_NOTE
-            self.state.copy_mode = COPY_MODE_WITHIN_NOTE
+            # Rebuilds the mode dependent options, the new editor reads them from the state
+            self.state.update_copy_mode(COPY_MODE_WITHIN_NOTE)
             # Lazy access to the field editor
             self.active_field_to_field_editor = None
             # Init Basic tab in WithinNoteCopyEditor
-            self.within_note_editor_tab.editor_tabs.create_basic_tab()
+            self.get_within_note_editor_tab().editor_tabs.create_basic_tab()
+
+    def get_across_notes_editor_tab(self) -> AcrossNotesCopyEditor:
+        if self.across_notes_editor_tab is None:
+            layout = QVBoxLayout(self.across_notes_widget)
+            layout.setContentsMargins(0, 0, 0, 0)
+            self.across_notes_editor_tab = AcrossNotesCopyEditor(
+                self, self.state, self.copy_definition
+            )
+            layout.addWidget(self.across_notes_editor_tab)
+        return self.across_notes_editor_tab
+
+    def get_within_note_editor_tab(self) -> WithinNoteCopyEditor:
+        if self.within_note_editor_tab is None:
+            layout = QVBoxLayout(self.within_note_widget)
+            layout.setContentsMargins(0, 0, 0, 0)
+            self.within_note_editor_tab = WithinNoteCopyEditor(
+                self, self.state, self.copy_definition
+            )
+            layout.addWidget(self.within_note_editor_tab)
+        return self.within_note_editor_tab
+
+    def get_across_query_editor(self) -> AcrossQueryTabWidget:
+        """
+        Gets the search query tab's widget, creating it if needed. Reading several of its values
+        through this avoids going through the lazy properties of AcrossNotesCopyEditor each time.
+        """
+        across_notes_editor = self.get_across_notes_editor_tab()
+        across_notes_editor.create_and_set_across_query_editor()
+        return cast(AcrossQueryTabWidget, across_notes_editor.query_editor)
 
     def get_active_field_to_field_editor(self):
         """Get the active field to field editor lazily"""
         if self.active_field_to_field_editor is None:
             if self.selected_editor_type == COPY_MODE_ACROSS_NOTES:
                 self.active_field_to_field_editor = (
-                    self.across_notes_editor_tab.get_field_to_field_editor()
+                    self.get_across_notes_editor_tab().get_field_to_field_editor()
                 )
             else:
                 self.active_field_to_field_editor = (
-                    self.within_note_editor_tab.get_field_to_field_editor()
+                    self.get_within_note_editor_tab().get_field_to_field_editor()
                 )
         return self.active_field_to_field_editor
 
     def check_fields(self):
-        show_error = False
         missing_name_error = ""
         missing_copy_into_error = ""
         missing_copy_from_error = ""
@@ -1213,156 +1347,130 @@ class EditCopyDefinitionDialog(ScrollableQDialog):
         for field_to_field_definition in active_editor.get_field_to_field_defs():
             if field_to_field_definition["copy_into_note_field"] == "":
                 missing_copy_into_error = "Destination field cannot be empty."
-                show_error = True
 
             use_code = field_to_field_definition.get("use_code", False)
             if use_code:
                 # When using code, require copy_as_code to be non-empty, regardless of copy_from_text
                 if field_to_field_definition.get("copy_as_code", "") == "":
                     missing_copy_from_error = "Copied content cannot be empty."
-                    show_error = True
             else:
                 # When not using code, require copy_from_text to be non-empty, regardless of copy_as_code
                 if field_to_field_definition.get("copy_from_text", "") == "":
                     missing_copy_from_error = "Copied content cannot be empty."
-                    show_error = True
-        if self.state.definition_name is None or self.state.definition_name == "":
+        if not self.state.definition_name:
             missing_name_error = "Definition name cannot be empty."
-            show_error = True
 
         if self.selected_editor_type == COPY_MODE_ACROSS_NOTES:
-            # Use lazy access to query components
-            if self.across_notes_editor_tab.card_query_text_layout.get_text() == "":
-                show_error = True
+            query_editor = self.get_across_query_editor()
+            if query_editor.card_query_text_layout.get_text() == "":
                 missing_card_query_error = "Search text cannot be empty"
-            if (
-                self.across_notes_editor_tab.card_select_cbox.currentText()
-                not in SELECT_CARD_BY_VALUES
-            ):
-                show_error = True
+            if query_editor.card_select_cbox.currentText() not in SELECT_CARD_BY_VALUE_SET:
                 missing_card_select_error = "Card selection method must be selected"
 
-        if show_error:
-            showInfo(f"""Some required required fields are missing:
-                {missing_name_error if missing_name_error else ""}
-                {missing_copy_into_error if missing_copy_into_error else ""}
-                {missing_copy_from_error if missing_copy_from_error else ""}
-                {missing_card_query_error if missing_card_query_error else ""}
-                {missing_card_select_error if missing_card_select_error else ""}
-                """)
-        else:  # Check that name is unique
-            definition_name = self.state.definition_name
-            config = Config()
-            config.load()
-            name_match_count = 0
-            for definition in config.copy_definitions:
-                if definition["definition_name"] == definition_name:
-                    name_match_count += 1
-            if name_match_count > 1:
-                showInfo(
-                    "There is another copy definition with the same name. Please choose a unique"
-                    " name."
-                )
-            self.accept()
+        errors = [
+            error
+            for error in (
+                missing_name_error,
+                missing_copy_into_error,
+                missing_copy_from_error,
+                missing_card_query_error,
+                missing_card_select_error,
+            )
+            if error
+        ]
+        if errors:
+            showInfo("Some required fields are missing:\n" + "\n".join(errors))
+            return
+
+        # Check that name is unique
+        definition_name = self.state.definition_name
+        config = Config()
+        config.load()
+        name_matches = (
+            definition
+            for definition in config.copy_definitions
+            if definition["definition_name"] == definition_name
+        )
+        # Stop looking once a second match is found
+        if len(list(islice(name_matches, 2))) > 1:
+            showInfo(
+                "There is another copy definition with the same name. Please choose a unique"
+                " name."
+            )
+        self.saved_copy_definition = self.get_copy_definition()
+        self.accept()
 
     def get_copy_mode(self) -> CopyModeType:
         return self.selected_editor_type or COPY_MODE_ACROSS_NOTES
 
+    def get_editor_tabs_dict(
+        self, editor: Union[AcrossNotesCopyEditor, WithinNoteCopyEditor]
+    ) -> dict:
+        """
+        Gets the values from the editor tabs that both copy modes have.
+        """
+        condition_query_editor = editor.get_condition_query_editor()
+        tag_editor = editor.get_tag_editor()
+        return {
+            "field_to_variable_defs": (
+                editor.get_field_to_variable_editor().get_field_to_variable_defs()
+            ),
+            "field_to_field_defs": editor.get_field_to_field_editor().get_field_to_field_defs(),
+            "field_to_file_defs": editor.get_field_to_file_editor().get_field_to_file_defs(),
+            "copy_condition_query": condition_query_editor.condition_query_text_layout.get_text(),
+            "condition_only_on_sync": (
+                condition_query_editor.condition_only_on_sync_checkbox.isChecked()
+            ),
+            "add_tags": tag_editor.get_add_tags(),
+            "remove_tags": tag_editor.get_remove_tags(),
+            "card_actions": editor.get_card_actions_editor().get_card_actions(),
+        }
+
+    def get_across_notes_dict(self) -> dict:
+        across_notes_editor = self.get_across_notes_editor_tab()
+        mode_dict = self.get_editor_tabs_dict(across_notes_editor)
+        query_editor = self.get_across_query_editor()
+        # select_card_by has been validated in check_fields()
+        select_card_by = cast(SelectCardByType, query_editor.card_select_cbox.currentText())
+        mode_dict.update({
+            "copy_from_cards_query": query_editor.card_query_text_layout.get_text(),
+            "sort_by_field": query_editor.sort_by_field_cbox.currentText(),
+            "select_card_by": select_card_by,
+            "select_card_count": query_editor.card_select_count.text(),
+            "select_card_separator": query_editor.card_select_separator.text(),
+            "copy_mode": COPY_MODE_ACROSS_NOTES,
+            "across_mode_direction": across_notes_editor.get_selected_direction(),
+            "show_error_if_none_found": query_editor.show_error_for_none_found.isChecked(),
+            "run_also_if_no_sources_found": (
+                query_editor.run_also_if_no_sources_found_checkbox.isChecked()
+            ),
+        })
+        return mode_dict
+
+    def get_within_note_dict(self) -> dict:
+        mode_dict = self.get_editor_tabs_dict(self.get_within_note_editor_tab())
+        mode_dict.update({
+            "copy_mode": COPY_MODE_WITHIN_NOTE,
+            "across_mode_direction": None,
+            "copy_from_cards_query": None,
+            "sort_by_field": None,
+            "select_card_by": "None",
+            "select_card_count": None,
+            "select_card_separator": None,
+            "show_error_if_none_found": False,
+            "run_also_if_no_sources_found": False,
+        })
+        return mode_dict
+
     def get_copy_definition(self) -> Union[CopyDefinition, None]:
-        if self.selected_editor_type == COPY_MODE_ACROSS_NOTES:
-            field_to_field_editor = self.across_notes_editor_tab.get_field_to_field_editor()
-            tag_editor = self.across_notes_editor_tab.get_tag_editor()
-            field_to_file_editor = self.across_notes_editor_tab.get_field_to_file_editor()
-            field_to_variable_editor = self.across_notes_editor_tab.get_field_to_variable_editor()
-            condition_query_editor = self.across_notes_editor_tab.get_condition_query_editor()
-            card_actions_editor = self.across_notes_editor_tab.get_card_actions_editor()
-            # select_card_by has been validated in check_fields()
-            select_card_by = cast(
-                SelectCardByType, self.across_notes_editor_tab.card_select_cbox.currentText()
-            )
-            across_copy_definition: CopyDefinition = {
-                "guid": (
-                    self.copy_definition.get("guid", str(uuid.uuid4()))
-                    if self.copy_definition
-                    else str(uuid.uuid4())
-                ),
-                "definition_name": self.state.definition_name,
-                "copy_into_note_types": self.state.copy_into_note_types,
-                "only_copy_into_decks": self.state.only_copy_into_decks,
-                "include_subdecks": self.state.include_subdecks,
-                "copy_on_sync": self.state.copy_on_sync,
-                "copy_on_add": self.state.copy_on_add,
-                "copy_on_review": self.state.copy_on_review,
-                "field_to_field_defs": field_to_field_editor.get_field_to_field_defs(),
-                "field_to_file_defs": field_to_file_editor.get_field_to_file_defs(),
-                "field_to_variable_defs": field_to_variable_editor.get_field_to_variable_defs(),
-                "copy_from_cards_query": (
-                    self.across_notes_editor_tab.card_query_text_layout.get_text()
-                ),
-                "copy_condition_query": (
-                    condition_query_editor.condition_query_text_layout.get_text()
-                ),
-                "condition_only_on_sync": (
-                    condition_query_editor.condition_only_on_sync_checkbox.isChecked()
-                ),
-                "add_tags": tag_editor.get_add_tags(),
-                "remove_tags": tag_editor.get_remove_tags(),
-                "card_actions": card_actions_editor.get_card_actions(),
-                "sort_by_field": self.across_notes_editor_tab.sort_by_field_cbox.currentText(),
-                "select_card_by": select_card_by,
-                "select_card_count": self.across_notes_editor_tab.card_select_count.text(),
-                "select_card_separator": self.across_notes_editor_tab.card_select_separator.text(),
-                "copy_mode": COPY_MODE_ACROSS_NOTES,
-                "across_mode_direction": self.across_notes_editor_tab.get_selected_direction(),
-                "show_error_if_none_found": (
-                    self.across_notes_editor_tab.show_error_for_none_found.isChecked()
-                ),
-                "run_also_if_no_sources_found": (
-                    self.across_notes_editor_tab.query_editor.run_also_if_no_sources_found_checkbox.isChecked()
-                ),
-            }
-            return across_copy_definition
-        elif self.selected_editor_type == COPY_MODE_WITHIN_NOTE:
-            field_to_variable_editor = self.within_note_editor_tab.get_field_to_variable_editor()
-            field_to_field_editor = self.within_note_editor_tab.get_field_to_field_editor()
-            tag_editor = self.within_note_editor_tab.get_tag_editor()
-            field_to_file_editor = self.within_note_editor_tab.get_field_to_file_editor()
-            condition_query_editor = self.within_note_editor_tab.get_condition_query_editor()
-            card_actions_editor = self.within_note_editor_tab.get_card_actions_editor()
-            within_copy_definition: CopyDefinition = {
-                "guid": (
-                    self.copy_definition.get("guid", str(uuid.uuid4()))
-                    if self.copy_definition
-                    else str(uuid.uuid4())
-                ),
-                "definition_name": self.state.definition_name,
-                "copy_into_note_types": self.state.copy_into_note_types,
-                "only_copy_into_decks": self.state.only_copy_into_decks,
-                "include_subdecks": self.state.include_subdecks,
-                "copy_on_sync": self.state.copy_on_sync,
-                "copy_on_add": self.state.copy_on_add,
-                "copy_on_review": self.state.copy_on_review,
-                "field_to_variable_defs": field_to_variable_editor.get_field_to_variable_defs(),
-                "field_to_field_defs": field_to_field_editor.get_field_to_field_defs(),
-                "field_to_file_defs": field_to_file_editor.get_field_to_file_defs(),
-                "copy_condition_query": (
-                    condition_query_editor.condition_query_text_layout.get_text()
-                ),
-                "condition_only_on_sync": (
-                    condition_query_editor.condition_only_on_sync_checkbox.isChecked()
-                ),
-                "add_tags": tag_editor.get_add_tags(),
-                "remove_tags": tag_editor.get_remove_tags(),
-                "card_actions": card_actions_editor.get_card_actions(),
-                "copy_mode": COPY_MODE_WITHIN_NOTE,
-                "across_mode_direction": None,
-                "copy_from_cards_query": None,
-                "sort_by_field": None,
-                "select_card_by": "None",
-                "select_card_count": None,
-                "select_card_separator": None,
-                "show_error_if_none_found": False,
-                "run_also_if_no_sources_found": False,
-            }
-            return within_copy_definition
-        return None
+        get_mode_dict = self.mode_dict_getters.get(self.selected_editor_type)
+        if get_mode_dict is None:
+            return None
+        copy_definition = cast(CopyDefinition, self.state.as_base_dict())
+        copy_definition["guid"] = (
+            self.copy_definition.get("guid", str(uuid.uuid4()))
+            if self.copy_definition
+            else str(uuid.uuid4())
+        )
+        copy_definition.update(get_mode_dict())
+        return copy_definition
@@ -1,8 +1,9 @@
 import re
 import uuid
 import copy
-from contextlib import suppress
-from typing import Union, Optional, cast, Sequence
+from collections import ChainMap
+from functools import lru_cache
+from typing import Callable, Union, Optional, cast, Sequence
 
 from aqt import mw
 
@@ -21,6 +22,9 @@ from aqt.qt import (
     QFontDatabase,
     QToolTip,
     QPoint,
+    QTimer,
+    QPalette,
+    QColor,
     Qt,
     qtmajor,
 )
@@ -34,6 +38,7 @@ from .interpolated_text_edit import InterpolatedTextEditLayout
 from ..logic.interpolate_fields import (
     intr_format,
 )
+from ..logic.regex_process import get_piped_flags
 from .required_text_input import RequiredLineEdit
 
 from .list_input import ListInputWidget
@@ -44,10 +49,14 @@ if qtmajor > 5:
     WindowModal = Qt.WindowModality.WindowModal
     QFixedFont = QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont)
     QAlignLeft = Qt.AlignmentFlag.AlignLeft
+    WA_DeleteOnClose = Qt.WidgetAttribute.WA_DeleteOnClose
+    QWindowTextRole = QPalette.ColorRole.WindowText
 else:
     WindowModal = Qt.WindowModal  # type: ignore
     QFixedFont = QFontDatabase.systemFont(QFontDatabase.FixedFont)  # type: ignore
     QAlignLeft = Qt.AlignLeft  # type: ignore
+    WA_DeleteOnClose = Qt.WA_DeleteOnClose  # type: ignore
+    QWindowTextRole = QPalette.WindowText  # type: ignore
 
 from ..configuration import (
     CopyDefinition,
@@ -76,13 +85,19 @@ from ..configuration import (
 )
 
 from ..logic.jp_text_processing.kana.kana_highlight import FuriReconstruct
+from ..utils.block_signals import block_signals
 
 
 class ClickableLabel(QLabel):
+    # Shared by all labels, created on first use as a QApplication must exist first
+    label_font: Optional[QFont] = None
+
     def __init__(self, text, tooltip_text, parent=None):
         super().__init__(f"{text} (?)", parent)
         self.tooltip_text = tooltip_text
-        self.setFont(QFont("SansSerif", 10))
+        if ClickableLabel.label_font is None:
+            ClickableLabel.label_font = QFont("SansSerif", 10)
+        self.setFont(ClickableLabel.label_font)
 
     def mousePressEvent(self, event):
         # Show tooltip near the label when clicked
@@ -92,17 +107,34 @@ class ClickableLabel(QLabel):
         self.setText(f"{text} (?)")
 
 
+def make_button_grid(ok_button: QPushButton, close_button: QPushButton) -> QGridLayout:
+    """
+    Makes the grid with the OK and Cancel buttons at the bottom of each process dialog.
+    """
+    grid = QGridLayout()
+    for column in range(3):
+        grid.setColumnMinimumWidth(column, 150)
+    grid.addWidget(ok_button, 0, 0)
+    grid.addWidget(close_button, 0, 2)
+    return grid
+
+
+KANJIUM_TO_JAVDEJONG_DESCRIPTION = """
+        Convert a field containing pitch accents in the Kanjium format into to the JavdeJong format.
+        If the field doesn't contain Kanjium format pitch accents, nothing is done.
+        """
+
+
 class KanjiumToJavdejongProcessDialog(QDialog):
+    description = KANJIUM_TO_JAVDEJONG_DESCRIPTION
+
     def __init__(self, parent, process: KanjiumToJavdejongProcess):
         super().__init__(parent)
         self.process = process
 
-        self.description = """
-        Convert a field containing pitch accents in the Kanjium format into to the JavdeJong format.
-        If the field doesn't contain Kanjium format pitch accents, nothing is done.
-        """
         self.form = QFormLayout()
         self.setWindowModality(WindowModal)
+        self.setAttribute(WA_DeleteOnClose, True)
         self.setLayout(self.form)
 
         self.top_label = QLabel(self.description)
@@ -111,8 +143,9 @@ class KanjiumToJavdejongProcessDialog(QDialog):
         self.delimiter_field = QLineEdit()
         self.form.addRow("Delimiter between multiple pitch accents", self.delimiter_field)
 
-        with suppress(KeyError):
-            self.delimiter_field.setText(self.process["delimiter"])
+        delimiter = self.process.get("delimiter")
+        if delimiter is not None:
+            self.delimiter_field.setText(delimiter)
 
         # Add Ok and Cancel buttons as QPushButtons
         self.ok_button = QPushButton("OK")
@@ -121,15 +154,9 @@ class KanjiumToJavdejongProcessDialog(QDialog):
         self.ok_button.clicked.connect(self.save_process)
         self.close_button.clicked.connect(self.reject)
 
-        self.bottom_grid = QGridLayout()
-        self.bottom_grid.setColumnMinimumWidth(0, 150)
-        self.bottom_grid.setColumnMinimumWidth(1, 150)
-        self.bottom_grid.setColumnMinimumWidth(2, 150)
+        self.bottom_grid = make_button_grid(self.ok_button, self.close_button)
         self.form.addRow(self.bottom_grid)
 
-        self.bottom_grid.addWidget(self.ok_button, 0, 0)
-        self.bottom_grid.addWidget(self.close_button, 0, 2)
-
     def save_process(self):
         self.process = {
             "name": KANJIUM_TO_JAVDEJONG_PROCESS,
@@ -138,30 +165,68 @@ class KanjiumToJavdejongProcessDialog(QDialog):
         self.accept()
 
 
-def validate_interpolatable_regex(dialog) -> bool:
+# How long to wait after the last keystroke before validating a regex
+REGEX_VALIDATE_DELAY_MS = 200
+
+
+@lru_cache(maxsize=256)
+def get_regex_error(pattern: str, flags: int = 0) -> Optional[str]:
+    """
+    Returns the error from compiling the regex or None, if it's valid.
+    Cached as re.compile only caches the patterns that compile successfully.
+    """
     try:
-        # Escape the interpolation syntax as a hack to let compiling the regex otherwise
-        # work as a way to validate it
-        validate_text = (
-            dialog.regex_field_layout.get_text().replace("{{", r"\{\{").replace("}}", r"\}\}")
-        )
-        re.compile(validate_text)
-        dialog.regex_error_display.setText("")
+        re.compile(pattern, flags)
     except re.error as e:
-        dialog.regex_error_display.setText(f"Error: {e}")
+        return str(e)
+    return None
+
+
+def make_regex_error_label() -> QLabel:
+    # Color the text through the palette, as a stylesheet would need parsing for every label
+    label = QLabel()
+    palette = label.palette()
+    palette.setColor(QWindowTextRole, QColor("red"))
+    label.setPalette(palette)
+    return label
+
+
+def show_regex_error(dialog, pattern: str, flags: int = 0) -> bool:
+    # An empty regex is always valid, no need to compile it or to cache it
+    error = get_regex_error(pattern, flags) if pattern else None
+    if error is not None:
+        dialog.regex_error_display.setText(f"Error: {error}")
         return False
+    dialog.regex_error_display.setText("")
     return True
 
 
+def validate_interpolatable_regex(dialog) -> bool:
+    # Escape the interpolation syntax as a hack to let compiling the regex otherwise
+    # work as a way to validate it
+    validate_text = (
+        dialog.regex_field_layout.get_text().replace("{{", r"\{\{").replace("}}", r"\}\}")
+    )
+    # Flags like VERBOSE change what's a valid regex, so compile with the selected ones
+    flags = dialog.flags_field.currentText()
+    return show_regex_error(dialog, validate_text, get_piped_flags(flags) if flags else 0)
+
+
 def validate_plain_regex(dialog) -> bool:
-    try:
-        validate_text = dialog.regex_field.toPlainText()
-        re.compile(validate_text)
-        dialog.regex_error_display.setText("")
-    except re.error as e:
-        dialog.regex_error_display.setText(f"Error: {e}")
-        return False
-    return True
+    return show_regex_error(dialog, dialog.regex_field.toPlainText())
+
+
+def make_regex_validate_timer(dialog, validate) -> QTimer:
+    """
+    Makes a timer that runs the validation once typing has paused, instead of on every keystroke.
+    """
+    timer = QTimer(dialog)
+    timer.setSingleShot(True)
+    timer.setInterval(REGEX_VALIDATE_DELAY_MS)
+    timer.timeout.connect(lambda: validate(dialog))
+    # Don't validate a dialog that was closed while the timer was running
+    dialog.finished.connect(lambda _: timer.stop())
+    return timer
 
 
 REGEX_FLAGS_DESCRIPTION = """
@@ -173,7 +238,28 @@ DOTALL - S: Make . match any character, including newlines. Use to match across
 """
 
 
+REGEX_PROCESS_DESCRIPTION = """
+        Basic regex processing step that replaces the text that matches the regex with the
+        replacement.
+        """
+
+USE_ALL_NOTES_TOOLTIP = """
+        If checked, the regex and replacement is constructed per note in the query, concatenating
+        the results together. That is, for a regex "XYZ" and 3 queried notes you get "XYZXYZXYZ"
+        where within each "XYZ" the values from each note are used.
+        <br />
+        This is only needed in destination to sources mode, if you are querying more than one note,
+        and then only sometimes.
+        """
+
+REGEX_FIELD_DESCRIPTION = f"""<ul>
+            <li>Reference the notes field and variables as you would in the main value</li>
+            <li>Right-click to select a {intr_format('Field Name')} or special values to paste</li>
+            </ul>"""
+
+
 class RegexProcessDialog(QDialog):
+    description = REGEX_PROCESS_DESCRIPTION
 
     def __init__(
         self,
@@ -185,10 +271,6 @@ class RegexProcessDialog(QDialog):
         super().__init__(parent)
         self.process = process
 
-        self.description = """
-        Basic regex processing step that replaces the text that matches the regex with the
-        replacement.
-        """
         self.state = state
         self.is_variable_extra_processing = is_variable_extra_processing
 
@@ -199,10 +281,13 @@ class RegexProcessDialog(QDialog):
         self.variable_names_callback = state.add_variable_names_callback(
             self.update_field_options, is_visible=False
         )
+        # The dialog is deleted on close, so stop the state from calling it after that
+        self.finished.connect(lambda _: self.remove_callbacks())
 
         self.initialized = False
         self.form = QFormLayout()
         self.setWindowModality(WindowModal)
+        self.setAttribute(WA_DeleteOnClose, True)
         self.setLayout(self.form)
 
         self.top_label = QLabel(self.description)
@@ -211,14 +296,7 @@ class RegexProcessDialog(QDialog):
         self.use_all_notes_checkbox = QCheckBox(
             "Use all notes from query (regex and replacement gets repeated for each note)"
         )
-        self.use_all_notes_checkbox.setToolTip("""
-        If checked, the regex and replacement is constructed per note in the query, concatenating
-        the results together. That is, for a regex "XYZ" and 3 queried notes you get "XYZXYZXYZ"
-        where within each "XYZ" the values from each note are used.
-        <br />
-        This is only needed in destination to sources mode, if you are querying more than one note,
-        and then only sometimes.
-        """)
+        self.use_all_notes_checkbox.setToolTip(USE_ALL_NOTES_TOOLTIP)
         self.form.addRow(self.use_all_notes_checkbox)
         # Only show this checkbox if this is not a variable extra processing and destination to sources mode
         if (
@@ -233,19 +311,13 @@ class RegexProcessDialog(QDialog):
         self.regex_field_layout = InterpolatedTextEditLayout(
             label="Regex",
             is_required=True,
-            description=f"""<ul>
-            <li>Reference the notes field and variables as you would in the main value</li>
-            <li>Right-click to select a {intr_format('Field Name')} or special values to paste</li>
-            </ul>""",
+            description=REGEX_FIELD_DESCRIPTION,
         )
         # Since this is code, set a mono font
         self.regex_field_layout.text_edit.setFont(QFixedFont)
         self.regex_field_widget = QWidget()
         self.regex_field_widget.setLayout(self.regex_field_layout)
         self.form.addRow(self.regex_field_widget)
-        self.regex_field_layout.text_edit.textChanged.connect(
-            lambda: validate_interpolatable_regex(self)
-        )
 
         self.regex_separator_edit = RequiredLineEdit()
         self.regex_separator_edit.setPlaceholderText(
@@ -257,8 +329,7 @@ class RegexProcessDialog(QDialog):
             self.regex_separator_edit,
         )
 
-        self.regex_error_display = QLabel()
-        self.regex_error_display.setStyleSheet("color: red;")
+        self.regex_error_display = make_regex_error_label()
         self.form.addRow("", self.regex_error_display)
 
         self.replacement_field_layout = InterpolatedTextEditLayout(
@@ -290,20 +361,28 @@ class RegexProcessDialog(QDialog):
         regex_label = ClickableLabel("Flags", REGEX_FLAGS_DESCRIPTION, self)
         self.form.addRow(regex_label, self.flags_field)
 
-        with suppress(KeyError):
-            self.regex_field_layout.text_edit.setPlainText(self.process["regex"])
-        with suppress(KeyError):
-            self.replacement_field_layout.set_text(self.process["replacement"])
-        with suppress(KeyError):
-            flags = self.process["flags"]
-            if flags:
-                self.flags_field.setCurrentText(flags)
-        with suppress(KeyError):
-            self.regex_separator_edit.setText(self.process.get("regex_separator", ""))
-        with suppress(KeyError):
-            self.replacement_separator_edit.setText(self.process.get("replacement_separator", ""))
-        with suppress(KeyError):
-            self.use_all_notes_checkbox.setChecked(self.process.get("use_all_notes", False))
+        for key, set_value in (
+            ("regex", self.regex_field_layout.text_edit.setPlainText),
+            ("replacement", self.replacement_field_layout.set_text),
+            ("regex_separator", self.regex_separator_edit.setText),
+            ("replacement_separator", self.replacement_separator_edit.setText),
+        ):
+            value = self.process.get(key)
+            if value is not None:
+                set_value(value)
+        flags = self.process.get("flags")
+        if flags:
+            self.flags_field.setCurrentText(flags)
+        self.use_all_notes_checkbox.setChecked(self.process.get("use_all_notes", False))
+
+        # Validate the saved regex once, and only connect the revalidation after setting the
+        # saved values so that they don't start the timer
+        validate_interpolatable_regex(self)
+        self.regex_validate_timer = make_regex_validate_timer(self, validate_interpolatable_regex)
+        self.regex_field_layout.text_edit.textChanged.connect(
+            lambda: self.regex_validate_timer.start()
+        )
+        self.flags_field.currentTextChanged.connect(lambda: self.regex_validate_timer.start())
 
         # Add Ok and Cancel buttons as QPushButtons
         self.ok_button = QPushButton("OK")
@@ -312,15 +391,9 @@ class RegexProcessDialog(QDialog):
         self.ok_button.clicked.connect(self.save_process)
         self.close_button.clicked.connect(self.reject)
 
-        self.bottom_grid = QGridLayout()
-        self.bottom_grid.setColumnMinimumWidth(0, 150)
-        self.bottom_grid.setColumnMinimumWidth(1, 150)
-        self.bottom_grid.setColumnMinimumWidth(2, 150)
+        self.bottom_grid = make_button_grid(self.ok_button, self.close_button)
         self.form.addRow(self.bottom_grid)
 
-        self.bottom_grid.addWidget(self.ok_button, 0, 0)
-        self.bottom_grid.addWidget(self.close_button, 0, 2)
-
         # Don't initialize field options here - do it lazily when dialog is shown
 
         if not self.should_enable_separators():
@@ -330,6 +403,10 @@ class RegexProcessDialog(QDialog):
         self.selected_model_callback.is_visible = True
         self.variable_names_callback.is_visible = True
 
+    def remove_callbacks(self):
+        self.state.remove_selected_model_callback(self.selected_model_callback)
+        self.state.remove_variable_names_callback(self.variable_names_callback)
+
     def initialize_ui_state(self):
         """Perform expensive UI state initialization when dialog is first shown"""
         if self.initialized:
@@ -354,6 +431,10 @@ class RegexProcessDialog(QDialog):
     #     self.disable_callbacks()
 
     def save_process(self):
+        # Validate right away in case typing stopped less than the validate delay ago
+        self.regex_validate_timer.stop()
+        if not validate_interpolatable_regex(self):
+            return
         self.process = {
             "name": REGEX_PROCESS,
             "regex": self.regex_field_layout.get_text(),
@@ -366,18 +447,19 @@ class RegexProcessDialog(QDialog):
         self.accept()
 
     def update_field_options(self):
-        options_dict = {}
-        validate_dict = {}
         if self.is_variable_extra_processing:
             # If this is a variable extra processing, variables_dict can't be used since this is
             # making it!
-            options_dict = self.state.pre_query_menu_options_dict.copy()
-            validate_dict = self.state.pre_query_text_edit_validate_dict.copy()
+            options_dict = self.state.pre_query_menu_options_dict
+            validate_dict = self.state.pre_query_text_edit_validate_dict
         elif self.state.copy_mode == COPY_MODE_WITHIN_NOTE:
-            options_dict = self.state.pre_query_menu_options_dict.copy()
-            options_dict.update(self.state.variables_dict)
-            validate_dict = self.state.pre_query_text_edit_validate_dict.copy()
-            validate_dict.update(self.state.variables_dict)
+            # Merged views instead of copies, the variables take precedence like with update()
+            options_dict = ChainMap(
+                self.state.variables_dict, self.state.pre_query_menu_options_dict
+            )
+            validate_dict = ChainMap(
+                self.state.variables_dict, self.state.pre_query_text_edit_validate_dict
+            )
         else:
             options_dict = self.state.post_query_menu_options_dict
             validate_dict = self.state.post_query_text_edit_validate_dict
@@ -416,54 +498,27 @@ class RegexProcessDialog(QDialog):
         return False
 
 
-class FontsCheckProcessDialog(QDialog):
-    def __init__(self, parent, process: FontsCheckProcess):
-        super().__init__(parent)
-        self.process = process
-
-        self.description = """
+FONTS_CHECK_DESCRIPTION = """
         For the given text, go through all the characters and return the fonts for which every
         character has an entry in the JSON file for.
         The JSON file is intended be something pre-generated from a script that checks which fonts
         support which characters.
         """
-        self.form = QFormLayout()
-        self.setWindowModality(WindowModal)
-        self.setLayout(self.form)
 
-        self.top_label = QLabel(self.description)
-        self.form.addRow(self.top_label)
-
-        self.fonts_dict_file_field = QLineEdit()
-        self.form.addRow("Fonts dict JSON file", self.fonts_dict_file_field)
-        self.form.addRow(
-            "",
-            QLabel("""<small>Provide the file name only, e.g. 'fonts_by_char.json'.
+FONTS_DICT_FILE_HELP_HTML = """<small>Provide the file name only, e.g. 'fonts_by_char.json'.
         <br/>
         The file is assumed to be in your Anki collection.media folder.
         <br/>
         The content should be <code>{"char": ["font1", "font2", ...], "char2": ...}</code>
-        </small>"""),
-        )
+        </small>"""
 
-        self.limit_to_fonts_field = ListInputWidget()
-        self.form.addRow("Limit to fonts", self.limit_to_fonts_field)
-        self.form.addRow(
-            "",
-            QLabel("""<small>
+LIMIT_TO_FONTS_HELP_HTML = """<small>
         (Optional) A list of font file names (without the file ending) to limit the output to.
         <br/>
         You can add multiple fonts at once inputting a single item of comma separated values
-        </small>"""),
-        )
+        </small>"""
 
-        self.regex_field = AutoResizingTextEdit()
-        self.regex_field.setFont(QFixedFont)
-        self.form.addRow("Char limit", self.regex_field)
-        self.regex_field.textChanged.connect(lambda: validate_plain_regex(self))
-        self.form.addRow(
-            "",
-            QLabel("""<small>(Optional) Regex used to limit the characters checked.
+CHARACTER_LIMIT_REGEX_HELP_HTML = """<small>(Optional) Regex used to limit the characters checked.
         <br/>
         When using regex your dictionary should contain an "all_fonts" key that contains all
         possible fonts.
@@ -475,22 +530,52 @@ class FontsCheckProcessDialog(QDialog):
         You probably want this to be a character range
         <br/>
         e.g. <code>[a-z]</code> or <code>[\u4e00-\u9fff]</code>.
-        </small>"""),
-        )
+        </small>"""
+
+
+class FontsCheckProcessDialog(QDialog):
+    description = FONTS_CHECK_DESCRIPTION
+
+    def __init__(self, parent, process: FontsCheckProcess):
+        super().__init__(parent)
+        self.process = process
+
+        self.form = QFormLayout()
+        self.setWindowModality(WindowModal)
+        self.setAttribute(WA_DeleteOnClose, True)
+        self.setLayout(self.form)
+
+        self.top_label = QLabel(self.description)
+        self.form.addRow(self.top_label)
 
-        self.regex_error_display = QLabel()
-        self.regex_error_display.setStyleSheet("color: red;")
+        self.fonts_dict_file_field = QLineEdit()
+        self.form.addRow("Fonts dict JSON file", self.fonts_dict_file_field)
+        self.form.addRow("", QLabel(FONTS_DICT_FILE_HELP_HTML))
+
+        self.limit_to_fonts_field = ListInputWidget()
+        self.form.addRow("Limit to fonts", self.limit_to_fonts_field)
+        self.form.addRow("", QLabel(LIMIT_TO_FONTS_HELP_HTML))
+
+        self.regex_field = AutoResizingTextEdit()
+        self.regex_field.setFont(QFixedFont)
+        self.form.addRow("Char limit", self.regex_field)
+        self.form.addRow("", QLabel(CHARACTER_LIMIT_REGEX_HELP_HTML))
+
+        self.regex_error_display = make_regex_error_label()
         self.form.addRow("", self.regex_error_display)
 
-        with suppress(KeyError):
-            self.fonts_dict_file_field.setText(self.process["fonts_dict_file"])
-        with suppress(KeyError):
-            limit_to_fonts = self.process.get("limit_to_fonts")
-            if limit_to_fonts:
-                for font in limit_to_fonts:
-                    self.limit_to_fonts_field.add_item(font)
-        with suppress(KeyError):
-            self.regex_field.setPlainText(self.process["character_limit_regex"])
+        fonts_dict_file = self.process.get("fonts_dict_file")
+        if fonts_dict_file is not None:
+            self.fonts_dict_file_field.setText(fonts_dict_file)
+        self.limit_to_fonts_field.add_items(self.process.get("limit_to_fonts") or [])
+        character_limit_regex = self.process.get("character_limit_regex")
+        if character_limit_regex is not None:
+            self.regex_field.setPlainText(character_limit_regex)
+
+        # As in RegexProcessDialog, validate the saved regex once before connecting
+        validate_plain_regex(self)
+        self.regex_validate_timer = make_regex_validate_timer(self, validate_plain_regex)
+        self.regex_field.textChanged.connect(lambda: self.regex_validate_timer.start())
 
         # Add Ok and Cancel buttons as QPushButtons
         self.ok_button = QPushButton("OK")
@@ -499,16 +584,14 @@ class FontsCheckProcessDialog(QDialog):
         self.ok_button.clicked.connect(self.save_process)
         self.close_button.clicked.connect(self.reject)
 
-        self.bottom_grid = QGridLayout()
-        self.bottom_grid.setColumnMinimumWidth(0, 150)
-        self.bottom_grid.setColumnMinimumWidth(1, 150)
-        self.bottom_grid.setColumnMinimumWidth(2, 150)
+        self.bottom_grid = make_button_grid(self.ok_button, self.close_button)
         self.form.addRow(self.bottom_grid)
 
-        self.bottom_grid.addWidget(self.ok_button, 0, 0)
-        self.bottom_grid.addWidget(self.close_button, 0, 2)
-
     def save_process(self):
+        # Validate right away in case typing stopped less than the validate delay ago
+        self.regex_validate_timer.stop()
+        if not validate_plain_regex(self):
+            return
         self.process = {
             "name": FONTS_CHECK_PROCESS,
             "fonts_dict_file": self.fonts_dict_file_field.text(),
@@ -518,6 +601,25 @@ class FontsCheckProcessDialog(QDialog):
         self.accept()
 
 
+# Matches each name in a '"name1", "name2"' string. A name may contain quotes itself, so a
+# name only ends at a quote that's followed by the separator or the end of the string
+QUOTED_NAMES_RE = re.compile(r'"(.*?)"(?:, |$)')
+
+
+def get_note_types_field_names(copy_into_note_types: str) -> list[str]:
+    """
+    Returns the field names of all the note types in the copy_into_note_types string,
+    in order and without duplicates.
+    """
+    field_names: dict[str, None] = {}
+    for note_type_name in QUOTED_NAMES_RE.findall(copy_into_note_types):
+        note_type = mw.col.models.by_name(note_type_name)
+        if note_type is None:
+            continue
+        field_names.update(dict.fromkeys(mw.col.models.field_names(note_type)))
+    return list(field_names)
+
+
 KANA_HIGHLIGHT_DESCRIPTION = """
 Kana highlight processing takes in kanji text that has furigana.
 It then bolds the furigana that corresponds to the kanji text, and removes the kanji
@@ -527,14 +629,16 @@ The kanji, onyomi and kunyomi fields are gotten from the destination note type.
 
 
 class KanaHighlightProcessDialog(QDialog):
-    def __init__(self, parent, process: KanaHighlightProcess, copy_into_note_types: Optional[str]):
+    description = KANA_HIGHLIGHT_DESCRIPTION
+
+    def __init__(self, parent, process: KanaHighlightProcess, field_names: list[str]):
         super().__init__(parent)
         self.process = process
-        self.copy_into_note_types = copy_into_note_types
+        self.field_names = field_names
 
-        self.description = KANA_HIGHLIGHT_DESCRIPTION
         self.form = QFormLayout()
         self.setWindowModality(WindowModal)
+        self.setAttribute(WA_DeleteOnClose, True)
         self.setLayout(self.form)
 
         self.top_label = QLabel(self.description)
@@ -563,20 +667,14 @@ class KanaHighlightProcessDialog(QDialog):
 
         self.update_combobox_options()
 
-        with suppress(KeyError):
-            self.kanji_field_cbox.setCurrentText(self.process.get("kanji_field"))
-        with suppress(KeyError):
-            self.return_type_cbox.setCurrentText(self.process.get("return_type"))
-        with suppress(KeyError):
-            self.wrap_readings_checkbox.setChecked(self.process.get("wrap_readings_in_tags", False))
-        with suppress(KeyError):
-            self.merge_consecutive_tags_checkbox.setChecked(
-                self.process.get("merge_consecutive_tags", False)
-            )
-        with suppress(KeyError):
-            self.onyomi_to_katakana_checkbox.setChecked(
-                self.process.get("onyomi_to_katakana", False)
-            )
+        self.kanji_field_cbox.setCurrentText(self.process.get("kanji_field"))
+        self.return_type_cbox.setCurrentText(self.process.get("return_type"))
+        for key, checkbox in (
+            ("wrap_readings_in_tags", self.wrap_readings_checkbox),
+            ("merge_consecutive_tags", self.merge_consecutive_tags_checkbox),
+            ("onyomi_to_katakana", self.onyomi_to_katakana_checkbox),
+        ):
+            checkbox.setChecked(self.process.get(key, False))
 
         # Add Ok and Cancel buttons as QPushButtons
         self.ok_button = QPushButton("OK")
@@ -585,15 +683,9 @@ class KanaHighlightProcessDialog(QDialog):
         self.ok_button.clicked.connect(self.save_process)
         self.close_button.clicked.connect(self.reject)
 
-        self.bottom_grid = QGridLayout()
-        self.bottom_grid.setColumnMinimumWidth(0, 150)
-        self.bottom_grid.setColumnMinimumWidth(1, 150)
-        self.bottom_grid.setColumnMinimumWidth(2, 150)
+        self.bottom_grid = make_button_grid(self.ok_button, self.close_button)
         self.form.addRow(self.bottom_grid)
 
-        self.bottom_grid.addWidget(self.ok_button, 0, 0)
-        self.bottom_grid.addWidget(self.close_button, 0, 2)
-
     def save_process(self):
         return_type = cast(FuriReconstruct, self.return_type_cbox.currentText())
         self.process = {
@@ -607,14 +699,11 @@ class KanaHighlightProcessDialog(QDialog):
         self.accept()
 
     def update_combobox_options(self):
-        if self.copy_into_note_types is None:
+        if not self.field_names:
             return
-        for note_type_name in self.copy_into_note_types.strip('""').split('", "'):
-            note_type = mw.col.models.by_name(note_type_name)
-            if note_type is None:
-                continue
-            for field_name in mw.col.models.field_names(note_type):
-                self.kanji_field_cbox.addItem(field_name)
+        # Nothing listens to the selection yet, so skip emitting it for the first added item
+        with block_signals(self.kanji_field_cbox):
+            self.kanji_field_cbox.addItems(self.field_names)
 
 
 WORD_HIGHLIGHT_DESCRIPTION = """
@@ -622,14 +711,16 @@ WORD_HIGHLIGHT_DESCRIPTION = """
 
 
 class WordHighlightProcessDialog(QDialog):
-    def __init__(self, parent, process: WordHighlightProcess, copy_into_note_types: Optional[str]):
+    description = WORD_HIGHLIGHT_DESCRIPTION
+
+    def __init__(self, parent, process: WordHighlightProcess, field_names: list[str]):
         super().__init__(parent)
         self.process = process
-        self.copy_into_note_types = copy_into_note_types
+        self.field_names = field_names
 
-        self.description = WORD_HIGHLIGHT_DESCRIPTION
         self.form = QFormLayout()
         self.setWindowModality(WindowModal)
+        self.setAttribute(WA_DeleteOnClose, True)
         self.setLayout(self.form)
 
         self.top_label = QLabel(self.description)
@@ -640,8 +731,7 @@ class WordHighlightProcessDialog(QDialog):
 
         self.update_combobox_options()
 
-        with suppress(KeyError):
-            self.word_field_cbox.setCurrentText(self.process.get("word_field"))
+        self.word_field_cbox.setCurrentText(self.process.get("word_field"))
 
         # Add Ok and Cancel buttons as QPushButtons
         self.ok_button = QPushButton("OK")
@@ -650,15 +740,9 @@ class WordHighlightProcessDialog(QDialog):
         self.ok_button.clicked.connect(self.save_process)
         self.close_button.clicked.connect(self.reject)
 
-        self.bottom_grid = QGridLayout()
-        self.bottom_grid.setColumnMinimumWidth(0, 150)
-        self.bottom_grid.setColumnMinimumWidth(1, 150)
-        self.bottom_grid.setColumnMinimumWidth(2, 150)
+        self.bottom_grid = make_button_grid(self.ok_button, self.close_button)
         self.form.addRow(self.bottom_grid)
 
-        self.bottom_grid.addWidget(self.ok_button, 0, 0)
-        self.bottom_grid.addWidget(self.close_button, 0, 2)
-
     def save_process(self):
         self.process = {
             "name": WORD_HIGHLIGHT_PROCESS,
@@ -667,14 +751,43 @@ class WordHighlightProcessDialog(QDialog):
         self.accept()
 
     def update_combobox_options(self):
-        if self.copy_into_note_types is None:
+        if not self.field_names:
             return
-        for note_type_name in self.copy_into_note_types.strip('""').split('", "'):
-            note_type = mw.col.models.by_name(note_type_name)
-            if note_type is None:
-                continue
-            for field_name in mw.col.models.field_names(note_type):
-                self.word_field_cbox.addItem(field_name)
+        # Nothing listens to the selection yet, so skip emitting it for the first added item
+        with block_signals(self.word_field_cbox):
+            self.word_field_cbox.addItems(self.field_names)
+
+
+# The row label getter and the description shown in the row's tooltip for each process
+PROCESS_LABEL_GETTERS_AND_DESCRIPTIONS: dict[str, tuple[Callable[[AnyProcess], str], str]] = {
+    KANA_HIGHLIGHT_PROCESS: (lambda _: KANA_HIGHLIGHT_PROCESS, KANA_HIGHLIGHT_DESCRIPTION),
+    WORD_HIGHLIGHT_PROCESS: (lambda _: WORD_HIGHLIGHT_PROCESS, WORD_HIGHLIGHT_DESCRIPTION),
+    REGEX_PROCESS: (get_regex_process_label, REGEX_PROCESS_DESCRIPTION),
+    FONTS_CHECK_PROCESS: (get_fonts_check_process_label, FONTS_CHECK_DESCRIPTION),
+    KANJIUM_TO_JAVDEJONG_PROCESS: (
+        lambda _: KANJIUM_TO_JAVDEJONG_PROCESS,
+        KANJIUM_TO_JAVDEJONG_DESCRIPTION,
+    ),
+}
+
+# Makes the dialog for editing a process, given the EditExtraProcessingWidget and the process
+PROCESS_DIALOG_MAKERS: dict[str, Callable[["EditExtraProcessingWidget", AnyProcess], QDialog]] = {
+    KANA_HIGHLIGHT_PROCESS: lambda widget, process: KanaHighlightProcessDialog(
+        widget, cast(KanaHighlightProcess, process), widget.get_copy_into_field_names()
+    ),
+    WORD_HIGHLIGHT_PROCESS: lambda widget, process: WordHighlightProcessDialog(
+        widget, cast(WordHighlightProcess, process), widget.get_copy_into_field_names()
+    ),
+    REGEX_PROCESS: lambda widget, process: RegexProcessDialog(
+        widget, cast(RegexProcess, process), widget.state, widget.is_variable_extra_processing
+    ),
+    FONTS_CHECK_PROCESS: lambda widget, process: FontsCheckProcessDialog(
+        widget, cast(FontsCheckProcess, process)
+    ),
+    KANJIUM_TO_JAVDEJONG_PROCESS: lambda widget, process: KanjiumToJavdejongProcessDialog(
+        widget, cast(KanjiumToJavdejongProcess, process)
+    ),
+}
 
 
 class EditExtraProcessingWidget(QWidget):
@@ -696,7 +809,8 @@ class EditExtraProcessingWidget(QWidget):
         self.is_variable_extra_processing = is_variable_extra_processing
         self.vbox = QVBoxLayout()
         self.setLayout(self.vbox)
-        self.process_dialogs: list[QDialog] = []
+        # The options last added to add_process_chain_button
+        self.process_combobox_options: Optional[list[str]] = None
         # GUID-based process UI tracking
         self.process_ui_components: dict[str, dict] = {}  # Maps process GUID to its UI components
         try:
@@ -711,15 +825,10 @@ class EditExtraProcessingWidget(QWidget):
             self.vbox.addWidget(processes_widget)
             return processes_layout
 
-        self.processes_layout = make_processes_container()
-
         # Add header above the processes container
-        header_widget = QWidget()
-        header_layout = QHBoxLayout(header_widget)
-        header_layout.setContentsMargins(0, 0, 0, 0)
-        header_layout.addWidget(QLabel("<h4>Extra processing</h4>"))
-        header_layout.addStretch()
-        self.vbox.insertWidget(0, header_widget)  # Insert at top, before processes container
+        self.vbox.addWidget(QLabel("<h4>Extra processing</h4>"))
+
+        self.processes_layout = make_processes_container()
 
         for index, process in enumerate(self.process_chain):
             self.add_process_row(index, process)
@@ -732,21 +841,42 @@ class EditExtraProcessingWidget(QWidget):
         # Initialize field definition and combobox
         self.field_to_x_def["process_chain"] = cast(Sequence[AnyProcess], self.process_chain)
         self.init_options_to_process_combobox()
+        self.add_process_chain_button.currentTextChanged.connect(self.add_process)
         self.vbox.addWidget(self.add_process_chain_button)
 
     def init_options_to_process_combobox(self):
-        currently_active_processes = [process["name"] for process in self.process_chain]
-
-        self.add_process_chain_button.clear()
-        # Add options not currently active to the combobox
-        for process in self.allowed_process_names:
-            if (
-                process not in currently_active_processes
-                or process in MULTIPLE_ALLOWED_PROCESS_NAMES
-            ):
-                self.add_process_chain_button.addItem(process)
-        # Reconnect signal now that we're done calling addItem
-        self.add_process_chain_button.currentTextChanged.connect(self.add_process)
+        currently_active_processes = {process["name"] for process in self.process_chain}
+        # Options not currently active
+        process_options = [
+            process
+            for process in self.allowed_process_names
+            if process not in currently_active_processes
+            or process in MULTIPLE_ALLOWED_PROCESS_NAMES
+        ]
+
+        # Block signals so that changing the items doesn't call add_process
+        with block_signals(self.add_process_chain_button):
+            if self.process_combobox_options is None:
+                self.add_process_chain_button.addItems(process_options)
+            elif process_options != self.process_combobox_options:
+                self.update_process_combobox_items(self.process_combobox_options, process_options)
+            self.process_combobox_options = process_options
+            # Reset the selection to show the placeholder again
+            self.add_process_chain_button.unset_current_index()
+
+    def update_process_combobox_items(self, old_options: list[str], new_options: list[str]):
+        """
+        Removes and inserts only the options that changed, as usually only one process gets
+        added or removed. Both lists are in the order of allowed_process_names, so after removing
+        the options that are gone, the rest can be inserted at their index in new_options.
+        """
+        new_options_set = set(new_options)
+        for index in reversed(range(len(old_options))):
+            if old_options[index] not in new_options_set:
+                self.add_process_chain_button.removeItem(index)
+        for index, process_name in enumerate(new_options):
+            if self.add_process_chain_button.itemText(index) != process_name:
+                self.add_process_chain_button.insertItem(index, process_name)
 
     def get_process_chain(self):
         return self.process_chain
@@ -757,115 +887,118 @@ class EditExtraProcessingWidget(QWidget):
             process["guid"] = str(uuid.uuid4())
 
         process_guid = process["guid"]
-        process_dialog, get_process_name = self.get_process_dialog_and_name(process)
+        get_process_name, description = self.get_process_name_and_description(process)
 
-        if process_dialog is None:
+        if get_process_name is None:
             return
 
-        self.process_dialogs.append(process_dialog)
-
         # Create a widget to contain this process row
         process_widget = QWidget()
         process_layout = QHBoxLayout(process_widget)
         process_layout.setContentsMargins(5, 5, 5, 5)
 
         # Add the process label
-        process_label = ClickableLabel(get_process_name(process), process_dialog.description, self)
+        process_label = ClickableLabel(get_process_name(process), description, self)
         process_layout.addStretch()  # Push buttons to the right
         process_layout.addWidget(process_label)
 
-        def process_dialog_exec():
-            if process_dialog.exec():
-                for i, cur_process in enumerate(self.process_chain):
-                    if cur_process["guid"] == process_guid:
-                        self.process_chain[i] = process_dialog.process
-                        # Update the GUID tracking since process object may have changed
-                        if "guid" not in process_dialog.process:
-                            process_dialog.process["guid"] = process_guid
-                        else:
-                            # Update the tracking dict key if GUID changed
-                            if process_dialog.process["guid"] != process_guid:
-                                self.process_ui_components[process_dialog.process["guid"]] = (
-                                    self.process_ui_components.pop(process_guid)
-                                )
-                # Instead of remaking the whole grid, just update the label
-                process_label.setText(get_process_name(process_dialog.process))
-                return 0
-            return -1
-
         # Edit button
         edit_button = QPushButton("Edit")
-        edit_button.clicked.connect(lambda: process_dialog_exec())
         process_layout.addWidget(edit_button)
 
         # Remove button
         remove_button = QPushButton("Delete")
-
-        def remove_row_ui():
-            # Remove the entire process widget from the layout
-            self.processes_layout.removeWidget(process_widget)
-            process_widget.deleteLater()
+        process_layout.addWidget(remove_button)
 
         # Store UI components for this process GUID
-        self.process_ui_components[process_guid] = {
+        ui_components: dict = {
             "widget": process_widget,
             "label": process_label,
             "edit_button": edit_button,
             "remove_button": remove_button,
-            "remove_ui_func": remove_row_ui,
-            "dialog": process_dialog,
+            "get_process_name": get_process_name,
+            "guid": process_guid,
         }
+        self.process_ui_components[process_guid] = ui_components
 
-        def remove_row():
-            # Use targeted removal without needing reindexing
-            self.remove_process_by_guid(process_guid)
-
-        remove_button.clicked.connect(remove_row)
-        process_layout.addWidget(remove_button)
+        edit_button.clicked.connect(lambda: self.edit_process_row(ui_components))
+        # The GUID is read from the components instead of being captured here, so that it
+        # can't go stale after an edit
+        remove_button.clicked.connect(lambda: self.remove_process_by_guid(ui_components["guid"]))
 
         # Add the process widget to the processes layout
         self.processes_layout.addWidget(process_widget)
 
+    def edit_process_row(self, ui_components: dict) -> int:
+        # Read the GUID from the components as it may have changed on a previous edit
+        current_guid = ui_components["guid"]
+        index = self.get_process_index(current_guid)
+        if index is None:
+            return -1
+        # Make a new dialog from the current process for each edit. The dialog deletes itself
+        # when closed, so cancelled edits and its widgets don't linger until the next edit.
+        process_dialog = self.make_process_dialog(self.process_chain[index])
+        if not process_dialog.exec():
+            return -1
+        # The process is a plain dict, so it can still be read after the dialog was deleted
+        edited_process = process_dialog.process
+        self.process_chain[index] = edited_process
+        # Update the GUID tracking since process object may have changed
+        if "guid" not in edited_process:
+            edited_process["guid"] = current_guid
+        else:
+            # Update the tracking dict key if GUID changed
+            new_guid = edited_process["guid"]
+            if new_guid != current_guid:
+                self.process_ui_components[new_guid] = self.process_ui_components.pop(
+                    current_guid
+                )
+                ui_components["guid"] = new_guid
+        # Instead of remaking the whole grid, just update the label
+        ui_components["label"].setLabelText(ui_components["get_process_name"](edited_process))
+        return 0
+
+    def get_process_index(self, process_guid: str) -> Optional[int]:
+        """
+        Returns the current index of the process in the process chain, or None if it's not there.
+        Indexes shift as processes are removed, so rows look it up by GUID instead of keeping it.
+        """
+        for index, process in enumerate(self.process_chain):
+            if process.get("guid") == process_guid:
+                return index
+        return None
+
     def remove_process_by_guid(self, process_guid: str):
         """Remove a specific process and its UI components by GUID without rebuilding the entire UI."""
         # Find and remove the process from the chain
-        process_to_remove = None
-        for i, process in enumerate(self.process_chain):
-            if process.get("guid") == process_guid:
-                process_to_remove = process
-                self.process_chain.pop(i)
-                break
-
-        if process_to_remove is None:
+        index = self.get_process_index(process_guid)
+        if index is None:
             return
+        del self.process_chain[index]
 
         # Remove UI components
         if process_guid in self.process_ui_components:
             ui_components = self.process_ui_components[process_guid]
-            ui_components["remove_ui_func"]()
-
-            # Remove dialog from dialogs list
-            if ui_components["dialog"] in self.process_dialogs:
-                self.process_dialogs.remove(ui_components["dialog"])
-                ui_components["dialog"].deleteLater()
+            # Remove the entire process widget from the layout
+            self.processes_layout.removeWidget(ui_components["widget"])
+            ui_components["widget"].deleteLater()
 
             # Remove from tracking
             del self.process_ui_components[process_guid]
 
         # Update process chain and combobox (no reindexing needed with vertical layout)
         self.field_to_x_def["process_chain"] = cast(Sequence[AnyProcess], self.process_chain)
-        # Disconnect signal to avoid calling add_process in an infinite loop
-        self.add_process_chain_button.currentTextChanged.disconnect(self.add_process)
         self.init_options_to_process_combobox()
 
     def add_process(self, process_name):
         self.add_process_chain_button.hidePopup()
         if not process_name:
             return
-        # Create a copy of the default process and assign GUID
-        new_process: AnyProcess = copy.deepcopy(NEW_PROCESS_DEFAULTS[process_name])
-        if new_process is None:
+        default_process = NEW_PROCESS_DEFAULTS.get(process_name)
+        if default_process is None:
             return
+        # Create a copy of the default process and assign GUID
+        new_process: AnyProcess = copy.deepcopy(default_process)
         new_process["guid"] = str(uuid.uuid4())
 
         # Append to process chain first
@@ -876,45 +1009,37 @@ class EditExtraProcessingWidget(QWidget):
 
         # Update field def and combobox without full UI rebuild
         self.field_to_x_def["process_chain"] = cast(Sequence[AnyProcess], self.process_chain)
-        # Disconnect signal to avoid calling add_process in an infinite loop
-        self.add_process_chain_button.currentTextChanged.disconnect(self.add_process)
         self.init_options_to_process_combobox()
 
-    def get_process_dialog_and_name(self, process):
+    def get_process_name_and_description(self, process):
+        """
+        Returns a function that gets the process's label and the process's description. The
+        dialog is made only when the row is edited, with make_process_dialog.
+        """
         try:
             process_name = process["name"]
         except KeyError:
             tooltip(f"Error: Process name not found in process: {process}")
             return None, ""
-        if process_name == KANA_HIGHLIGHT_PROCESS:
-            note_types = None
-            with suppress(KeyError):
-                if self.copy_definition:
-                    note_types = self.copy_definition["copy_into_note_types"]
-            return (
-                KanaHighlightProcessDialog(self, process, note_types),
-                lambda _: KANA_HIGHLIGHT_PROCESS,
-            )
-        if process_name == WORD_HIGHLIGHT_PROCESS:
-            note_types = None
-            with suppress(KeyError):
-                if self.copy_definition:
-                    note_types = self.copy_definition["copy_into_note_types"]
-            return (
-                WordHighlightProcessDialog(self, process, note_types),
-                lambda _: WORD_HIGHLIGHT_PROCESS,
-            )
-        if process_name == REGEX_PROCESS:
-            return (
-                RegexProcessDialog(self, process, self.state, self.is_variable_extra_processing),
-                get_regex_process_label,
-            )
-        if process_name == FONTS_CHECK_PROCESS:
-            return FontsCheckProcessDialog(self, process), get_fonts_check_process_label
-        if process_name == KANJIUM_TO_JAVDEJONG_PROCESS:
-            return (
-                KanjiumToJavdejongProcessDialog(self, process),
-                lambda _: KANJIUM_TO_JAVDEJONG_PROCESS,
-            )
+        return PROCESS_LABEL_GETTERS_AND_DESCRIPTIONS.get(process_name, (None, ""))
 
-        return None, ""
+    def get_copy_into_field_names(self) -> list[str]:
+        """
+        Returns the field names of the note types copied into, cached in the state so that every
+        kana and word highlight dialog doesn't look up the same note types again.
+        """
+        note_types = (
+            self.copy_definition.get("copy_into_note_types") if self.copy_definition else None
+        )
+        if not note_types:
+            return []
+        field_names = self.state.field_names_by_note_types.get(note_types)
+        if field_names is None:
+            field_names = get_note_types_field_names(note_types)
+            self.state.field_names_by_note_types[note_types] = field_names
+        return field_names
+
+    def make_process_dialog(self, process) -> QDialog:
+        # Rows are only added for processes found in PROCESS_LABEL_GETTERS_AND_DESCRIPTIONS,
+        # which has the same keys
+        return PROCESS_DIALOG_MAKERS[process["name"]](self, process)
@@ -3,7 +3,6 @@ from dataclasses import dataclass
 
 from anki.decks import DeckDict, DeckId
 from anki.models import NotetypeDict
-from anki.utils import ids2str
 from aqt import mw
 from aqt.qt import QCheckBox, QLabel
 
@@ -73,6 +72,16 @@ def call_callbacks(callbacks: list[CallbackEntry], **args):
         callbacks.remove(callback_entry)
 
 
+def remove_callback(callbacks: list[CallbackEntry], callback_entry: CallbackEntry):
+    """
+    Removes the callback entry from the list, if call_callbacks hasn't already removed it.
+    """
+    try:
+        callbacks.remove(callback_entry)
+    except ValueError:
+        pass
+
+
 class EditState:
     """
     Class to hold the shared state of the editors
@@ -84,15 +93,37 @@ class EditState:
         copy_mode: CopyModeType = COPY_MODE_WITHIN_NOTE,
     ):
         self.copy_mode = copy_mode
+        # Snapshot of all note types taken once per dialog, so that the editors don't each walk
+        # the collection's models again
+        self.all_models: list[NotetypeDict] = mw.col.models.all()
+        self.models_by_name: dict[str, NotetypeDict] = {
+            model["name"]: model for model in self.all_models
+        }
+        # Names are wrapped in "" in the multiboxes to avoid issues with commas in the name
+        self.models_by_quoted_name: dict[str, NotetypeDict] = {
+            f'"{model["name"]}"': model for model in self.all_models
+        }
+        # Decks of the cards of the selected note types along with their quoted names, toggling
+        # note types back and forth in the multibox would otherwise run the same queries again
+        self.decks_by_model_ids: dict[frozenset[int], tuple[list[DeckDict], list[str]]] = {}
+        # Field names of the note types in a copy_into_note_types value, shared by the kana and
+        # word highlight process dialogs of all the fields
+        self.field_names_by_note_types: dict[str, list[str]] = {}
         self.definition_name = ""
         self.copy_into_note_types: str = ""
         self.selected_models: list[NotetypeDict] = []
         self.only_copy_into_decks: str = ""
         self.include_subdecks: bool = False
         self.all_decks: list[DeckDict] = []
+        self.quoted_deck_names: list[str] = []
+        # The deck names in the config's order, and as a set for membership tests
         self.current_deck_names: list[str] = []
+        self.current_deck_names_set: frozenset[str] = frozenset()
+        # What current_deck_names was last parsed from
+        self.current_deck_names_key: Optional[str] = None
         self.current_decks: list[NotetypeDict] = []
         self.current_decks_in_all_decks: list[DeckDict] = []
+        self.quoted_current_deck_names: list[str] = []
         self.copy_on_sync: bool = False
         self.copy_on_add: bool = False
         self.copy_on_review: bool = False
@@ -102,7 +133,8 @@ class EditState:
         self.card_select_count: int = 1
         if copy_definition is not None:
             self.copy_mode = copy_definition.get("copy_mode", COPY_MODE_WITHIN_NOTE)
-            self.definition_name = copy_definition.get("definition_name", "")
+            # Editor changes are stripped in update_state, strip the loaded name to match
+            self.definition_name = copy_definition.get("definition_name", "").strip()
             self.copy_into_note_types = copy_definition.get("copy_into_note_types", "")
             self.only_copy_into_decks = copy_definition.get("only_copy_into_decks", "")
             self.include_subdecks = copy_definition.get("include_subdecks", False)
@@ -134,7 +166,16 @@ class EditState:
             self.copy_into_variables,
         )
         self.variables_validate_dict: dict[str, bool] = make_validate_dict(self.variables_dict)
+        # What variables_dict was last built from, to skip rebuilding it when nothing changed
+        self.variables_dict_key: tuple[CopyModeType, tuple[str, ...]] = (
+            self.copy_mode,
+            tuple(self.copy_into_variables),
+        )
         self.intersecting_fields: list[str] = get_intersecting_model_fields(self.selected_models)
+        # Copy mode and ids of the models selected_models was last updated with, to skip the
+        # updates and callbacks when the multibox text changes without the selection actually
+        # changing
+        self.selected_models_key: Optional[tuple[CopyModeType, tuple[int, ...]]] = None
         self.update_models()
 
         self.definition_name_editors: list[RequiredLineEdit] = []
@@ -294,20 +335,42 @@ class EditState:
 
         return connect_func
 
+    def as_base_dict(self) -> dict:
+        """
+        Returns the parts of a copy definition that are held in the shared state, for both
+        Across Notes and Within Note modes.
+        """
+        return {
+            "definition_name": self.definition_name,
+            "copy_into_note_types": self.copy_into_note_types,
+            "only_copy_into_decks": self.only_copy_into_decks,
+            "include_subdecks": self.include_subdecks,
+            "copy_on_sync": self.copy_on_sync,
+            "copy_on_add": self.copy_on_add,
+            "copy_on_review": self.copy_on_review,
+        }
+
     def update_models(self):
         """
         Updates the selected models in the state.
         """
-        models = list(
-            filter(
-                None,
-                [
-                    mw.col.models.by_name(name.strip('""'))
-                    for name in self.copy_into_note_types.split(", ")
-                ],
+        selected_models = []
+        for name in self.copy_into_note_types.split(", "):
+            # Fall back to the unquoted name, older configs may not have every name quoted
+            model = self.models_by_quoted_name.get(name) or self.models_by_name.get(
+                name.strip('"')
             )
+            if model is not None:
+                selected_models.append(model)
+        # The options dicts depend on the copy mode and the first model, so keep the order
+        selected_models_key = (
+            self.copy_mode,
+            tuple(model["id"] for model in selected_models),
         )
-        self.selected_models = models
+        if selected_models_key == self.selected_models_key:
+            return
+        self.selected_models_key = selected_models_key
+        self.selected_models = selected_models
         self.update_post_query_copy_from_options_dict()
         self.update_pre_query_copy_from_options_dict()
         self.update_decks()
@@ -350,6 +413,18 @@ class EditState:
         self.variable_names_callbacks.append(callback_entry)
         return callback_entry
 
+    def remove_selected_model_callback(self, callback_entry: CallbackEntry):
+        """
+        Removes a callback added with add_selected_model_callback, e.g. when its widget is closed.
+        """
+        remove_callback(self.selected_model_callbacks, callback_entry)
+
+    def remove_variable_names_callback(self, callback_entry: CallbackEntry):
+        """
+        Removes a callback added with add_variable_names_callback, e.g. when its widget is closed.
+        """
+        remove_callback(self.variable_names_callbacks, callback_entry)
+
     def add_copy_on_sync_callback(
         self, callback: Callable[[bool], None], is_visible: bool = False
     ) -> CallbackEntry:
@@ -370,38 +445,65 @@ class EditState:
             call_callbacks(self.copy_direction_callbacks)
             self.update_post_query_copy_from_options_dict()
 
+    def update_copy_mode(self, new_mode: CopyModeType):
+        """
+        Updates the copy mode in the state, rebuilding the options dicts and calling the selected
+        model callbacks for the new mode.
+        """
+        if new_mode != self.copy_mode:
+            self.copy_mode = new_mode
+            self.update_models()
+
     def update_decks(self):
         assert mw.col.db is not None
-        mids: list[int] = [model["id"] for model in self.selected_models]
-        dids: list[DeckId] = mw.col.db.list(f"""
-                SELECT DISTINCT CASE WHEN odid==0 THEN did ELSE odid END
-                FROM cards c, notes n
-                WHERE n.mid IN {ids2str(mids)}
-                AND c.nid = n.id
-            """)
-
-        current_deck_names = self.only_copy_into_decks.strip('""').split('", "')
-        all_decks = [mw.col.decks.get(did) for did in dids]
-        all_decks = [d for d in all_decks if d is not None]
-        deck_name_set = {deck["name"] for deck in all_decks}
-        # Include parent decks of current decks even if they're empty
-        for deck in all_decks:
-            deck_parents = mw.col.decks.parents(deck["id"])
-            for parent_deck in deck_parents:
-                if parent_deck["name"] not in deck_name_set:
-                    all_decks.append(parent_deck)
-                    deck_name_set.add(parent_deck["name"])
-        # sort decks by name
-        all_decks.sort(key=lambda d: d["name"])
-        current_decks_in_all_decks = [d for d in all_decks if d["name"] in current_deck_names]
+        mids_key = frozenset(model["id"] for model in self.selected_models)
+        cached_decks = self.decks_by_model_ids.get(mids_key)
+        if cached_decks is None:
+            dids: list[DeckId] = []
+            if mids_key:
+                dids = mw.col.db.list(
+                    f"""
+                    SELECT DISTINCT CASE WHEN c.odid == 0 THEN c.did ELSE c.odid END
+                    FROM notes n
+                    JOIN cards c ON c.nid = n.id
+                    WHERE n.mid IN ({", ".join("?" * len(mids_key))})
+                    """,
+                    *mids_key,
+                )
+            all_decks = [mw.col.decks.get(did) for did in dids]
+            all_decks = [d for d in all_decks if d is not None]
+            deck_name_set = {deck["name"] for deck in all_decks}
+            # Include parent decks of current decks even if they're empty
+            for deck in all_decks:
+                deck_parents = mw.col.decks.parents(deck["id"])
+                for parent_deck in deck_parents:
+                    if parent_deck["name"] not in deck_name_set:
+                        all_decks.append(parent_deck)
+                        deck_name_set.add(parent_deck["name"])
+            # sort decks by name
+            all_decks.sort(key=lambda d: d["name"])
+            cached_decks = (all_decks, [f'"{deck["name"]}"' for deck in all_decks])
+            self.decks_by_model_ids[mids_key] = cached_decks
+
+        all_decks, quoted_deck_names = cached_decks
+        if self.only_copy_into_decks != self.current_deck_names_key:
+            self.current_deck_names_key = self.only_copy_into_decks
+            self.current_deck_names = self.only_copy_into_decks.strip('""').split('", "')
+            self.current_deck_names_set = frozenset(self.current_deck_names)
+        current_deck_names_set = self.current_deck_names_set
+        current_decks_in_all_decks = [d for d in all_decks if d["name"] in current_deck_names_set]
         self.all_decks = all_decks
-        self.current_deck_names = current_deck_names
-        self.current_decks = list(
-            filter(
-                None,
-                [mw.col.models.by_name(model_name) for model_name in current_deck_names],
-            )
-        )
+        self.quoted_deck_names = quoted_deck_names
+        self.quoted_current_deck_names = [
+            quoted_name
+            for deck, quoted_name in zip(all_decks, quoted_deck_names)
+            if deck["name"] in current_deck_names_set
+        ]
+        self.current_decks = [
+            self.models_by_name[name]
+            for name in self.current_deck_names
+            if name in self.models_by_name
+        ]
         self.current_decks_in_all_decks = current_decks_in_all_decks
 
     def update_post_query_copy_from_options_dict(self):
@@ -434,41 +536,44 @@ class EditState:
                 add_model_options_to_dict(model["name"], model["id"], options_dict)
         else:
             # In across notes modes, add fields from all models
-            models = mw.col.models.all_names_and_ids()
             if self.copy_direction == DIRECTION_DESTINATION_TO_SOURCES:
                 # One destination model, many source models
-                for model in models:
+                for model in self.all_models:
                     # Only the trigger note models are potential destinations
                     # The destination note will get added twice, as a source and as a destination
-                    if model.name in trigger_model_names:
+                    if model["name"] in trigger_model_names:
                         add_model_options_to_dict(
-                            f"(Destination) {model.name}",
-                            model.id,
+                            f"(Destination) {model['name']}",
+                            model["id"],
                             options_dict,
                             DESTINATION_PREFIX,
                         )
                     # But every model is a potential source
-                    add_model_options_to_dict(model.name, model.id, options_dict)
+                    add_model_options_to_dict(model["name"], model["id"], options_dict)
             else:
                 # Many destination models, one source model
-                for model in models:
+                for model in self.all_models:
                     # Every model is a potential destination
                     add_model_options_to_dict(
-                        f"(Destination) {model.name}",
-                        model.id,
+                        f"(Destination) {model['name']}",
+                        model["id"],
                         options_dict,
                         DESTINATION_PREFIX,
                     )
                     # Only the trigger note models are potential sources
                     # The source note will get added twice, as a source and once as a destination
-                    if model.name in trigger_model_names:
-                        add_model_options_to_dict(model.name, model.id, options_dict)
+                    if model["name"] in trigger_model_names:
+                        add_model_options_to_dict(model["name"], model["id"], options_dict)
 
         self.post_query_menu_options_dict = options_dict
 
         self.post_query_text_edit_validate_dict = make_validate_dict(options_dict)
 
     def update_variable_names(self, copy_into_variables: list[str]):
+        variables_dict_key = (self.copy_mode, tuple(copy_into_variables))
+        if variables_dict_key == self.variables_dict_key:
+            return
+        self.variables_dict_key = variables_dict_key
         self.copy_into_variables = copy_into_variables
         variables_dict = get_variables_dict_from_variable_defs(
             copy_mode=self.copy_mode,
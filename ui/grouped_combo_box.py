@@ -1,4 +1,4 @@
-from typing import cast
+from typing import Iterable, cast
 from aqt.qt import (
     QStyledItemDelegate,
     QStandardItemModel,
@@ -31,6 +31,32 @@ class CenteredItemDelegate(QStyledItemDelegate):
         super().initStyleOption(option, index)
 
 
+def make_group_item(group_name: str) -> QStandardItem:
+    item = QStandardItem()
+    item.setEnabled(False)
+    item.setText(group_name)
+    item.setFont(QFont(item.font().family(), item.font().pointSize(), QBold))
+    item.setTextAlignment(QAlignCenter)
+    return item
+
+
+def build_grouped_model(
+    groups: dict[str, list[str]], ungrouped_items: Iterable[str] = ()
+) -> QStandardItemModel:
+    """
+    Builds the model for a GroupedComboBox in one go, for use with setGroupedModel.
+    The ungrouped items are placed before the groups.
+    """
+    model = QStandardItemModel()
+    for item_name in ungrouped_items:
+        model.appendRow(QStandardItem(item_name))
+    for group_name, item_names in groups.items():
+        model.appendRow(make_group_item(group_name))
+        for item_name in item_names:
+            model.appendRow(QStandardItem(item_name.strip()))
+    return model
+
+
 class GroupedComboBox(RequiredCombobox):
     """
     Custom QComboBox that allows for grouping of items.
@@ -44,13 +70,8 @@ class GroupedComboBox(RequiredCombobox):
         self.setItemDelegate(CenteredItemDelegate(self))  # Set the custom item delegate
 
     def addGroup(self, group_name):
-        item = QStandardItem()
-        item.setEnabled(False)
-        item.setText(group_name)
-        item.setFont(QFont(item.font().family(), item.font().pointSize(), QBold))
-        item.setTextAlignment(QAlignCenter)
         self.groups[group_name] = []
-        super().addItem(item)
+        super().addItem(make_group_item(group_name))
 
     def addItemToGroup(self, group_name, item_name):
         item_name = item_name.strip()
@@ -58,6 +79,14 @@ class GroupedComboBox(RequiredCombobox):
             self.groups[group_name].append(item_name)
             self.addItem(item_name)
 
+    def setGroupedModel(self, model: QStandardItemModel, groups: dict[str, list[str]]):
+        """
+        Replaces all items with a model made with build_grouped_model, instead of adding
+        them one by one with addGroup and addItemToGroup.
+        """
+        self.groups = {group_name: list(item_names) for group_name, item_names in groups.items()}
+        self.setModel(model)
+
     def setCurrentText(self, text):
         if not text:
             return
@@ -1,4 +1,4 @@
-from typing import Optional, Union
+from typing import Mapping, Optional, Union
 
 from aqt.qt import (
     QVBoxLayout,
@@ -59,7 +59,7 @@ class InterpolatedTextEditLayout(QVBoxLayout):
             options_dict = {}
         self.options_dict = options_dict
         # validation dict is 1-level dict with all possible fields as keys
-        self.validate_dict: dict[str, bool] = {}
+        self.validate_dict: Mapping[str, bool] = {}
 
         self.text_edit = PasteableTextEdit(
             parent,
@@ -104,7 +104,7 @@ class InterpolatedTextEditLayout(QVBoxLayout):
         else:
             self.optional_description.hide()
 
-    def update_options(self, new_options_dict: dict, new_validate_dict: dict):
+    def update_options(self, new_options_dict: Mapping, new_validate_dict: Mapping):
         """
         Updates the options in the "Define what to copy from" TextEdit right-click menu.
         """
@@ -1,3 +1,5 @@
+from typing import Iterable
+
 from aqt.qt import (
     QWidget,
     QVBoxLayout,
@@ -52,18 +54,21 @@ class ListInputWidget(QWidget):
         if item_text:
             # Handle possibly adding multiple items at once
             if len(item_text.split(",")) > 1:
-                for item in item_text.split(","):
-                    item = item.strip()
-                    if not item:
-                        # Skip empty items, if the input has a trailing comma or multiple commas
-                        continue
-                    # stripping whitespace is important
-                    self.list_widget.addItem(item)
+                # stripping whitespace is important. Skip empty items, if the input has a
+                # trailing comma or multiple commas
+                self.add_items(item.strip() for item in item_text.split(","))
                 self.input_field.clear()
             else:
                 self.list_widget.addItem(item_text)
                 self.input_field.clear()
 
+    def add_items(self, items: Iterable[str]):
+        """
+        Adds the non-empty items as is, in one call to the list widget. Use for pre-filling the
+        list, as unlike add_item, the items aren't split by commas.
+        """
+        self.list_widget.addItems([item for item in items if item])
+
     def remove_item(self):
         selected_items = self.list_widget.selectedItems()
         if not selected_items:
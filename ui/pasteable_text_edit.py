@@ -1,5 +1,5 @@
 from functools import partial
-from typing import Optional, Union
+from typing import Mapping, Optional, Union
 
 from aqt.qt import (
     QMenu,
@@ -104,9 +104,9 @@ class PasteableTextEdit(AutoResizingTextEdit):
             :param options: dict of options to add, possibly containing sub-dicts
             :return: None
             """
-            if isinstance(options, dict):
+            if isinstance(options, Mapping):
                 for key, value in options.items():
-                    if isinstance(value, dict):
+                    if isinstance(value, Mapping):
                         sub_menu = QMenu(key, parent=self)
                         menu.addMenu(sub_menu)
                         # If value is a dict, will recursively add sub-menu
@@ -134,7 +134,7 @@ class PasteableTextEdit(AutoResizingTextEdit):
         # Set the modified cursor back to the QTextEdit
         self.setTextCursor(cursor)
 
-    def set_options_dict(self, options_dict: dict):
+    def set_options_dict(self, options_dict: Mapping):
         self.options_dict = options_dict
 
     def clear_options(self):
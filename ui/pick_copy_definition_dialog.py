@@ -542,7 +542,8 @@ class PickCopyDefinitionDialog(ScrollableQDialog):
         dialog = EditCopyDefinitionDialog(self, definition)
 
         if dialog.exec():
-            copy_definition = dialog.get_copy_definition()
+            # The dialog deletes itself on close, so only its saved definition can be used here
+            copy_definition = dialog.saved_copy_definition
             if index is None and copy_definition is not None:
                 # Adding new definition
                 if "guid" not in copy_definition:
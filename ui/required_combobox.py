@@ -216,14 +216,20 @@ class RequiredCombobox(QComboBox):
         if not model:
             return
         nothing_was_selected = self.currentText() == ""
+        view = self.view() if self.auto_size else None
+        # Only resize once for the widest item instead of after each item
+        widest_item_width = 0
         for item in items:
             if item is None:
                 continue
             if isinstance(item, str):
                 item = QStandardItem(item)
             model.appendRow(item)
-            if self.auto_size:
-                self.check_text_width(item.text())
+            if view:
+                item_width = view.fontMetrics().boundingRect(item.text()).width()
+                widest_item_width = max(widest_item_width, item_width)
+        if widest_item_width:
+            self.update_max_width(widest_item_width)
         if nothing_was_selected:
             self.unset_current_index()
 
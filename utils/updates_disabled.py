@@ -0,0 +1,13 @@
+from contextlib import contextmanager
+
+
+@contextmanager
+def updates_disabled(*widgets):
+    widgets = tuple(widget for widget in widgets if widget is not None)
+    try:
+        for widget in widgets:
+            widget.setUpdatesEnabled(False)
+        yield
+    finally:
+        for widget in widgets:
+            widget.setUpdatesEnabled(True)